@@ -7,6 +7,7 @@ import sys
 from collections.abc import AsyncIterator
 from pathlib import Path
 
+import requests
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.templating import Jinja2Templates
@@ -39,22 +40,24 @@ templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
 
 @contextlib.asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Manage application lifespan events.
 
     Args:
-        _app: FastAPI application instance (required by lifespan signature)
+        app: FastAPI application instance
 
     Yields:
         None: Control is yielded to the application
     """
     # Startup
     logger.info("Starting Recipe Ingestion API")
-    # TODO: Initialize LLM client, validate configuration
+    # One HTTP session for all requests, so Ollama connections are reused
+    app.state.http_session = requests.Session()
+    # TODO: Validate configuration
     yield
     # Shutdown
     logger.info("Shutting down Recipe Ingestion API")
-    # TODO: Cleanup resources if needed
+    app.state.http_session.close()
 
 
 def create_app() -> FastAPI:
@@ -2,15 +2,16 @@
 
 import logging
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Literal
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field
 
-from recipe_ingest.config import load_settings
+from recipe_ingest.config import Settings, load_settings
 from recipe_ingest.core import process_recipe
 from recipe_ingest.llm import OllamaClient
 
@@ -66,12 +67,73 @@ class HealthResponse(BaseModel):
     vault_accessible: bool = Field(..., description="Vault path accessibility")
 
 
+def get_settings() -> Settings:
+    """Provide application settings to route handlers.
+
+    Returns:
+        Application settings instance
+
+    Raises:
+        HTTPException: 503 if the settings cannot be loaded
+    """
+    try:
+        return load_settings()
+    except Exception as e:
+        logger.exception(f"Failed to load settings: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Service temporarily unavailable. Configuration could not be loaded.",
+        ) from None
+
+
+def get_ollama_client(
+    request: Request, settings: Settings = Depends(get_settings)
+) -> Iterator[OllamaClient]:
+    """Provide an Ollama client configured from application settings.
+
+    The client uses the application's shared HTTP session (created in the app
+    lifespan) so connections to Ollama are reused across requests. Without one
+    (e.g. the lifespan did not run), the client gets a private session that is
+    closed once the request is done.
+
+    Args:
+        request: Incoming request, used to reach the application state
+        settings: Application settings
+
+    Yields:
+        Configured Ollama client
+
+    Raises:
+        HTTPException: 503 if the client cannot be created
+    """
+    session = getattr(request.app.state, "http_session", None)
+    # Only construction is guarded; errors from the route itself are handled there
+    try:
+        client = OllamaClient(
+            base_url=settings.llm.endpoint, model=settings.llm.model, session=session
+        )
+    except Exception as e:
+        logger.exception(f"Failed to create Ollama client: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Service temporarily unavailable. LLM client could not be created.",
+        ) from None
+    with client:
+        yield client
+
+
 @router.post("/recipes", response_model=RecipeResponse)
-async def ingest_recipe(request: RecipeRequest) -> RecipeResponse:
+async def ingest_recipe(
+    request: RecipeRequest,
+    settings: Settings = Depends(get_settings),
+    llm_client: OllamaClient = Depends(get_ollama_client),
+) -> RecipeResponse:
     """Ingest a recipe from text or URL.
 
     Args:
         request: Recipe ingestion request
+        settings: Application settings (injected)
+        llm_client: Ollama client (injected)
 
     Returns:
         Processing result with recipe path or error
@@ -85,9 +147,6 @@ async def ingest_recipe(request: RecipeRequest) -> RecipeResponse:
     logger.info(f"Received recipe request: {request.model_dump_json()}")
 
     try:
-        # Load configuration
-        settings = load_settings()
-
         # Validate vault path
         vault_path = settings.vault.path if settings.vault else None
         if not vault_path:
@@ -170,6 +229,7 @@ async def ingest_recipe(request: RecipeRequest) -> RecipeResponse:
             overwrite=request.overwrite,
             preview_only=request.preview,
             source_url=source_url,
+            llm_client=llm_client,
         )
 
         processing_time_ms = result.timing["total_time"] * 1000
@@ -226,21 +286,22 @@ async def ingest_recipe(request: RecipeRequest) -> RecipeResponse:
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check(
+    settings: Settings = Depends(get_settings),
+    llm_client: OllamaClient = Depends(get_ollama_client),
+) -> HealthResponse:
     """Check service health and dependencies.
 
+    Args:
+        settings: Application settings (injected)
+        llm_client: Ollama client (injected)
+
     Returns:
         Health status of service and dependencies
     """
-    # Load configuration
-    settings = load_settings()
-
     # Check Ollama connectivity
     ollama_connected = False
     try:
-        llm_endpoint = settings.llm.endpoint
-        llm_model = settings.llm.model
-        llm_client = OllamaClient(base_url=llm_endpoint, model=llm_model)
         ollama_connected = llm_client.health_check()
         logger.debug(f"Ollama health check: {ollama_connected}")
     except Exception as e:
@@ -2,6 +2,7 @@
 
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import BaseModel, Field, ValidationError
@@ -40,9 +41,43 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO", description="Logging level")
 
 
+def _env_fingerprint() -> tuple[tuple[str, str], ...]:
+    """Snapshot the environment variables that settings are built from.
+
+    Returns:
+        Sorted (name, value) pairs for RECIPE_INGEST_* variables and LLM_BASE_URL
+    """
+    return tuple(
+        sorted(
+            (name, value)
+            for name, value in os.environ.items()
+            if name.upper().startswith("RECIPE_INGEST_") or name == "LLM_BASE_URL"
+        )
+    )
+
+
 def load_settings() -> Settings:
     """Load application settings from environment variables.
 
+    Settings are cached per environment snapshot, so repeated calls (e.g. one per
+    API request) skip re-validation until a relevant variable changes. Each call
+    returns its own copy, so callers may modify it without affecting others.
+
+    Returns:
+        Application settings instance
+    """
+    return _load_settings(_env_fingerprint()).model_copy(deep=True)
+
+
+@lru_cache(maxsize=8)
+def _load_settings(
+    env_fingerprint: tuple[tuple[str, str], ...],  # noqa: ARG001 - only the lru_cache key
+) -> Settings:
+    """Build settings for one environment snapshot.
+
+    Args:
+        env_fingerprint: Result of _env_fingerprint(); used only as the cache key
+
     Returns:
         Application settings instance
     """
@@ -6,6 +6,12 @@ import yaml
 
 from recipe_ingest.models.recipe import Recipe
 
+# Prefer the libyaml-backed dumper; frontmatter only holds plain scalars and dicts
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,7 +81,9 @@ class MarkdownFormatter:
         metadata_dict["created"] = recipe.metadata.created.isoformat()
 
         # Convert to YAML
-        return yaml.dump(metadata_dict, default_flow_style=False, sort_keys=False)
+        return yaml.dump(
+            metadata_dict, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False
+        )
 
     def _format_body(self, recipe: Recipe) -> str:
         """Generate markdown body with ingredients and instructions.
@@ -99,13 +99,15 @@ def _compare_ingredients(ingredients1: list[str], ingredients2: list[str]) -> bo
 
 def process_recipe(
     input_text: str,
-    vault_path: Path,
+    vault_path: Path | None,
     llm_endpoint: str,
     llm_model: str,
     recipes_dir: str = "personal/recipes",
     overwrite: bool = False,
     preview_only: bool = False,
     source_url: str | None = None,
+    llm_client: OllamaClient | None = None,
+    skip_health_check: bool = False,
 ) -> ProcessingResult:
     """Process a recipe from input text to formatted markdown.
 
@@ -115,40 +117,57 @@ def process_recipe(
     - Duplicate detection with ingredient comparison
     - File writing (unless preview_only=True)
 
+    In preview mode the vault is optional: if vault_path is None or does not exist,
+    duplicate detection is skipped and nothing is created on disk.
+
     Args:
         input_text: Unstructured recipe text
-        vault_path: Path to Obsidian vault root
+        vault_path: Path to Obsidian vault root (may be None when preview_only=True)
         llm_endpoint: Ollama endpoint URL
         llm_model: Ollama model name
         recipes_dir: Relative path to recipes directory within vault
         overwrite: Whether to overwrite existing recipes
         preview_only: If True, don't write file, just return preview
         source_url: Optional source URL (e.g., Instagram post URL)
+        llm_client: Optional pre-configured LLM client; created from llm_endpoint
+            and llm_model when not provided
+        skip_health_check: If True, don't probe the LLM before extraction (the caller
+            has already verified it, or is using a stand-in client)
 
     Returns:
         ProcessingResult with recipe, markdown, file_path, timing, and duplicate info
 
     Raises:
         FileExistsError: If duplicate exists and overwrite is False or ingredients don't match
-        ValueError: If validation fails
+        ValueError: If validation fails, or vault_path is None outside preview mode
         ConnectionError: If LLM connection fails
         OSError: If file write fails
     """
+    if vault_path is None and not preview_only:
+        raise ValueError("vault_path is required unless preview_only=True")
+
     start_time = time.time()
     logger.info(f"Starting recipe processing (preview_only={preview_only})")
 
     # Initialize components
-    logger.debug("Initializing LLM client")
-    llm_client = OllamaClient(base_url=llm_endpoint, model=llm_model)
+    if llm_client is None:
+        logger.debug("Initializing LLM client")
+        llm_client = OllamaClient(base_url=llm_endpoint, model=llm_model)
 
     # Health check
-    if not llm_client.health_check():
+    if not skip_health_check and not llm_client.health_check():
         logger.error(f"Cannot connect to Ollama at {llm_endpoint}")
         raise ConnectionError(f"Cannot connect to Ollama at {llm_endpoint}")
 
     extractor = RecipeExtractor(llm_client=llm_client)
     formatter = MarkdownFormatter()
-    writer = VaultWriter(vault_path=vault_path, recipes_dir=recipes_dir)
+
+    # Preview mode never writes, so a missing vault only disables duplicate detection
+    writer: VaultWriter | None = None
+    if vault_path is None or (preview_only and not Path(vault_path).is_dir()):
+        logger.info("Preview mode: vault not available, skipping duplicate detection")
+    else:
+        writer = VaultWriter(vault_path=vault_path, recipes_dir=recipes_dir)
 
     # Extract recipe
     logger.info("Extracting recipe with LLM")
@@ -162,10 +181,10 @@ def process_recipe(
     )
 
     # Check for duplicates (always check, but only raise errors in non-preview mode)
-    is_duplicate = writer.check_duplicate(recipe.metadata.title)
+    is_duplicate = writer.check_duplicate(recipe.metadata.title) if writer else False
     duplicate_ingredients_match = False
 
-    if is_duplicate:
+    if is_duplicate and writer:
         logger.info(f"Duplicate recipe detected: {recipe.metadata.title}")
         # Read existing recipe to compare ingredients
         try:
@@ -236,6 +255,7 @@ def process_recipe(
     writing_time = 0.0
 
     if not preview_only:
+        assert writer is not None
         logger.info("Writing recipe to vault")
         write_start = time.time()
         file_path = writer.write(recipe.metadata.title, markdown, overwrite=overwrite)
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import time
 from typing import Any
 
 import requests
@@ -13,18 +14,52 @@ class OllamaClient:
     """Client for interacting with Ollama local LLM."""
 
     def __init__(
-        self, base_url: str = "http://localhost:11434", model: str = "llama3.1:8b"
+        self,
+        base_url: str = "http://localhost:11434",
+        model: str = "llama3.1:8b",
+        keep_alive: str | int | None = None,
+        session: requests.Session | None = None,
+        num_predict: int | None = None,
+        structured_output: bool = False,
     ) -> None:
         """Initialize the Ollama client.
 
         Args:
             base_url: Ollama API base URL
             model: Model name to use
+            keep_alive: How long Ollama keeps the model loaded after each request
+                (e.g. "30m", or -1 for forever); None uses the server default
+            session: Optional HTTP session to share keep-alive connections with other
+                clients; a private session is created when not provided (and closed
+                by close())
+            num_predict: Optional cap on generated tokens per request, so a model that
+                rambles past the JSON object stops early
+            structured_output: If True, send the schema as Ollama's "format" so decoding
+                is constrained to it (requires Ollama 0.5+)
         """
         self.base_url = base_url.rstrip("/")
         self.model = model
+        self.keep_alive = keep_alive
+        # Only a session created here is closed by close(); a shared one belongs to the caller
+        self._owns_session = session is None
+        self._session = session if session is not None else requests.Session()
+        self.num_predict = num_predict
+        self.structured_output = structured_output
         self._timeout = 120
 
+    def close(self) -> None:
+        """Close the client's private HTTP session (a shared session is left open)."""
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> "OllamaClient":
+        """Return the client for use as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the client's private HTTP session."""
+        self.close()
+
     def generate(
         self,
         prompt: str,
@@ -50,12 +85,16 @@ class OllamaClient:
         payload: dict[str, Any] = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
         }
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+        if self.num_predict is not None:
+            payload["options"] = {"num_predict": self.num_predict}
 
-        # Request JSON format if specified
+        # Request JSON format if specified, constrained to the schema when supported
         if format_json:
-            payload["format"] = "json"
+            payload["format"] = schema if schema and self.structured_output else "json"
 
         # Add schema to prompt if provided
         # Use compact JSON (no indentation) to reduce tokens
@@ -80,11 +119,7 @@ class OllamaClient:
             logger.debug(f"Prompt preview: {prompt_preview}")
 
         try:
-            response = requests.post(url, json=payload, timeout=self._timeout)
-            response.raise_for_status()
-
-            result = response.json()
-            response_text = result.get("response", "")
+            response_text = self._stream_response(url, payload)
 
             if not response_text:
                 logger.error("Empty response from Ollama")
@@ -130,6 +165,73 @@ class OllamaClient:
         except requests.exceptions.HTTPError as e:
             logger.error(f"Ollama HTTP error: {e}")
             raise ConnectionError(f"Ollama HTTP error: {e}") from e
+        except requests.exceptions.RequestException as e:
+            # Headers arrive before generation starts, so a dropped stream surfaces here
+            logger.error(f"Ollama request failed: {e}")
+            raise ConnectionError(f"Ollama request failed: {e}") from e
+
+    def _stream_response(self, url: str, payload: dict[str, Any]) -> str:
+        """POST a streaming generate request and join the response chunks.
+
+        Streaming means the timeout applies between chunks rather than to the
+        whole generation, and the body is consumed while the model is decoding.
+
+        Args:
+            url: Generate endpoint URL
+            payload: Request payload (with "stream": True)
+
+        Returns:
+            Full response text
+
+        Raises:
+            ConnectionError: If Ollama reports an error mid-stream or the stream ends
+                before the final ("done") chunk
+            ValueError: If a stream chunk is not valid JSON
+            requests.exceptions.RequestException: On transport or HTTP errors
+        """
+        start = time.perf_counter()
+        parts: list[str] = []
+        with self._session.post(url, json=payload, timeout=self._timeout, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                try:
+                    chunk = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid stream chunk from Ollama: {e}") from e
+                if "error" in chunk:
+                    raise ConnectionError(f"Ollama error: {chunk['error']}")
+                if not parts:
+                    logger.debug(f"First token after {time.perf_counter() - start:.2f}s")
+                parts.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    return "".join(parts)
+        raise ConnectionError("Ollama stream ended before generation finished")
+
+    def preload(self, keep_alive: str | int | None = None) -> None:
+        """Load the model into memory without generating anything.
+
+        Ollama loads a model on the first request that names it; sending an empty
+        prompt triggers that load up front so later timings exclude it.
+
+        Args:
+            keep_alive: How long Ollama keeps the model loaded (e.g. "30m", or -1 for
+                forever); defaults to the client's keep_alive, then to "30m"
+
+        Raises:
+            ConnectionError: If unable to connect to Ollama or the load fails
+        """
+        if keep_alive is None:
+            keep_alive = self.keep_alive if self.keep_alive is not None else "30m"
+        url = f"{self.base_url}/api/generate"
+        payload = {"model": self.model, "prompt": "", "keep_alive": keep_alive}
+        try:
+            response = self._session.post(url, json=payload, timeout=self._timeout)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to preload model '{self.model}': {e}")
+            raise ConnectionError(f"Failed to preload Ollama model '{self.model}': {e}") from e
 
     def health_check(self, retries: int = 3, delay: float = 2.0) -> bool:
         """Check if Ollama service is available.
@@ -144,7 +246,7 @@ class OllamaClient:
         for attempt in range(retries):
             try:
                 url = f"{self.base_url}/api/tags"
-                response = requests.get(url, timeout=5)
+                response = self._session.get(url, timeout=5)
                 response.raise_for_status()
                 return True
             except Exception as e:
@@ -152,8 +254,6 @@ class OllamaClient:
                     logger.debug(
                         f"Ollama health check attempt {attempt + 1}/{retries} failed: {e}, retrying in {delay}s..."
                     )
-                    import time
-
                     time.sleep(delay)
                 else:
                     logger.warning(f"Ollama health check failed after {retries} attempts: {e}")
@@ -170,7 +270,7 @@ class OllamaClient:
         """
         try:
             url = f"{self.base_url}/api/tags"
-            response = requests.get(url, timeout=5)
+            response = self._session.get(url, timeout=5)
             response.raise_for_status()
             data = response.json()
             return [model["name"] for model in data.get("models", [])]
@@ -22,6 +22,13 @@ class InstagramParser:
         r"https?://(www\.)?instagram\.com/tv/[A-Za-z0-9_-]+/.*",
     ]
 
+    # Compiled once at class definition so matching skips the re module cache lookup
+    _COMPILED_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in INSTAGRAM_URL_PATTERNS)
+    # Bytes variants for callers passing raw (undecoded) URLs
+    _COMPILED_BYTES_PATTERNS = tuple(
+        re.compile(p.encode("ascii"), re.IGNORECASE) for p in INSTAGRAM_URL_PATTERNS
+    )
+
     def __init__(self) -> None:
         """Initialize the Instagram parser with instaloader."""
         # Create Instaloader instance without login (for public content)
@@ -40,15 +47,18 @@ class InstagramParser:
         instaloader_logger = logging.getLogger("instaloader")
         instaloader_logger.setLevel(logging.ERROR)
 
-    def is_instagram_url(self, url: str) -> bool:
+    def is_instagram_url(self, url: str | bytes) -> bool:
         """Check if URL is an Instagram link.
 
         Args:
-            url: URL to check
+            url: URL to check (str, or bytes as received from raw request bodies)
 
         Returns:
             True if Instagram URL, False otherwise
         """
+        if isinstance(url, bytes | bytearray):
+            return self._is_instagram_url_bytes(bytes(url))
+
         if not url or not isinstance(url, str):
             return False
 
@@ -56,8 +66,27 @@ class InstagramParser:
         if not url:
             return False
 
+        # Cheap substring gate rejects most non-Instagram URLs before any regex runs
+        if "instagram.com" not in url.lower():
+            return False
+
         # Check against all patterns
-        return any(re.match(pattern, url, re.IGNORECASE) for pattern in self.INSTAGRAM_URL_PATTERNS)
+        return any(pattern.match(url) for pattern in self._COMPILED_PATTERNS)
+
+    def _is_instagram_url_bytes(self, url: bytes) -> bool:
+        """Check if a bytes URL is an Instagram link without decoding it.
+
+        Args:
+            url: URL bytes to check
+
+        Returns:
+            True if Instagram URL, False otherwise
+        """
+        url = url.strip()
+        if not url or b"instagram.com" not in url.lower():
+            return False
+
+        return any(pattern.match(url) for pattern in self._COMPILED_BYTES_PATTERNS)
 
     def clean_url(self, url: str) -> str:
         """Remove tracking parameters and fragments from Instagram URL.
@@ -107,20 +136,19 @@ class InstagramParser:
         path = parsed.path.strip("/")
 
         # Extract shortcode from path (format: /p/SHORTCODE or /reel/SHORTCODE or /tv/SHORTCODE)
-        parts = path.split("/")
-        if len(parts) >= 2:
-            # Get the shortcode (second part after /p/, /reel/, or /tv/)
-            shortcode = parts[1]
-            if shortcode:
-                return shortcode
+        # Partition instead of split to grab the second segment without building a list
+        _, _, rest = path.partition("/")
+        shortcode, _, _ = rest.partition("/")
+        if shortcode:
+            return shortcode
 
         raise ValueError(f"Could not extract shortcode from Instagram URL: {url}")
 
-    def parse(self, url: str) -> str:
+    def parse(self, url: str | bytes) -> str:
         """Extract recipe text from Instagram post.
 
         Args:
-            url: Instagram post URL
+            url: Instagram post URL (str, or UTF-8 bytes as accepted by is_instagram_url)
 
         Returns:
             Extracted caption text
@@ -129,17 +157,24 @@ class InstagramParser:
             ValueError: If URL is invalid or not an Instagram link
             ConnectionError: If unable to fetch Instagram content
         """
+        # Decode once so the helpers below only ever see str
+        if isinstance(url, bytes | bytearray):
+            try:
+                url = bytes(url).decode()
+            except UnicodeDecodeError:
+                raise ValueError(f"Invalid Instagram URL: {url!r}") from None
+
         if not self.is_instagram_url(url):
             raise ValueError(f"Invalid Instagram URL: {url}")
 
         # Clean URL to remove tracking parameters
         url = self.clean_url(url)
-        logger.info(f"Extracting caption from Instagram URL: {url}")
+        logger.info("Extracting caption from Instagram URL: %s", url)
 
         try:
             # Extract shortcode from URL
             shortcode = self._extract_shortcode(url)
-            logger.debug(f"Extracted shortcode: {shortcode}")
+            logger.debug("Extracted shortcode: %s", shortcode)
 
             # Load post using instaloader
             # Note: instaloader may show 403 warnings during retries (rate limiting),
@@ -147,35 +182,29 @@ class InstagramParser:
             try:
                 post = instaloader.Post.from_shortcode(self.loader.context, shortcode)
             except instaloader.exceptions.PostChangedException as e:
-                logger.error(f"Post changed or not found: {e}")
+                logger.error("Post changed or not found: %s", e)
                 raise ConnectionError(
                     "Instagram post not found or has been changed. "
                     "Please verify the URL is correct and the post is public."
                 ) from e
             except instaloader.exceptions.PrivateProfileNotFollowedException as e:
-                logger.error(f"Private profile: {e}")
+                logger.error("Private profile: %s", e)
                 raise ValueError(
                     "Cannot access Instagram post: The post is from a private account. "
                     "Only public posts can be accessed."
                 ) from e
             except instaloader.exceptions.LoginRequiredException as e:
-                logger.error(f"Login required: {e}")
+                logger.error("Login required: %s", e)
                 raise ConnectionError(
                     "Instagram requires login to access this content. "
                     "Please ensure the post is public."
                 ) from e
             except instaloader.exceptions.ConnectionException as e:
-                logger.error(f"Connection error: {e}")
+                logger.error("Connection error: %s", e)
                 raise ConnectionError(
                     "Failed to connect to Instagram. "
                     "Please check your internet connection and try again."
                 ) from e
-            except Exception as e:
-                logger.error(f"Unexpected error loading post: {e}")
-                raise ConnectionError(
-                    f"Failed to load Instagram post: {e}. "
-                    f"Please verify the URL is correct and try again."
-                ) from e
 
             # Extract caption
             caption = post.caption
@@ -188,7 +217,7 @@ class InstagramParser:
 
             # Ensure caption is a string type
             caption_str = str(caption) if caption else ""
-            logger.info(f"Successfully extracted caption ({len(caption_str)} characters)")
+            logger.info("Successfully extracted caption (%d characters)", len(caption_str))
             return caption_str
 
         except ValueError:
@@ -197,8 +226,10 @@ class InstagramParser:
         except ConnectionError:
             # Re-raise ConnectionError as-is
             raise
-        except Exception as e:
-            logger.exception(f"Unexpected error parsing Instagram URL: {e}")
+        except (instaloader.exceptions.InstaloaderException, OSError) as e:
+            # Known instaloader/network failures are expected (rate limiting, retries);
+            # log without a traceback. Anything else propagates to the caller untouched.
+            logger.error("Error parsing Instagram URL: %s", e, exc_info=False)
             raise ConnectionError(
                 f"Failed to extract content from Instagram URL: {e}. "
                 f"Please verify the URL is correct and try again."
@@ -1,24 +1,106 @@
 """Pytest configuration and shared fixtures."""
 
-import tempfile
-from collections.abc import Generator
+from collections.abc import Callable, Iterable
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from recipe_ingest.core import MarkdownFormatter
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register command-line options for the Ollama benchmarks."""
+    parser.addoption(
+        "--model-set",
+        action="append",
+        default=[],
+        metavar="MODELS",
+        help=(
+            "Comma-separated Ollama models to benchmark (overrides OLLAMA_MODELS); "
+            "repeat to sweep several model sets in one run"
+        ),
+    )
+
+
+class MockLLM:
+    """Minimal stand-in for OllamaClient that replays canned responses in order.
+
+    A plain class rather than Mock(spec=OllamaClient), so unit tests skip Mock's
+    attribute introspection and call recording.
+    """
+
+    def __init__(
+        self, responses: Iterable[dict[str, Any] | Exception], healthy: bool = True
+    ) -> None:
+        """Initialize the mock client.
+
+        Args:
+            responses: Responses returned by successive generate() calls; exceptions
+                are raised instead of returned
+            healthy: Value returned by health_check()
+        """
+        self._responses = iter(responses)
+        self.healthy = healthy
+        self.calls = 0
+
+    def generate(
+        self,
+        prompt: str,
+        schema: dict[str, Any] | None = None,
+        format_json: bool = True,
+    ) -> dict[str, Any]:
+        """Return (or raise) the next canned response."""
+        self.calls += 1
+        response = next(self._responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def health_check(self, retries: int = 3, delay: float = 2.0) -> bool:
+        """Return the configured health status."""
+        return self.healthy
+
 
 @pytest.fixture
-def temp_vault() -> Generator[Path, None, None]:
+def temp_vault(tmp_path: Path) -> Path:
     """Create a temporary Obsidian vault for testing.
 
-    Yields:
+    Built on pytest's tmp_path, so each test (and each xdist worker) gets its
+    own directory.
+
+    Returns:
         Path to temporary vault directory
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        vault_path = Path(tmpdir)
-        recipes_dir = vault_path / "personal" / "recipes"
-        recipes_dir.mkdir(parents=True, exist_ok=True)
-        yield vault_path
+    vault_path = tmp_path / "vault"
+    recipes_dir = vault_path / "personal" / "recipes"
+    recipes_dir.mkdir(parents=True, exist_ok=True)
+    return vault_path
+
+
+@pytest.fixture(scope="module")
+def module_vault(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary Obsidian vault shared by all tests in a module.
+
+    Only for tests that write distinct recipe titles; tests that rely on an
+    empty vault (e.g. duplicate detection) should use temp_vault instead.
+
+    Returns:
+        Path to temporary vault directory
+    """
+    vault_path = tmp_path_factory.mktemp("vault")
+    (vault_path / "personal" / "recipes").mkdir(parents=True)
+    return vault_path
+
+
+@pytest.fixture(scope="session")
+def formatter() -> MarkdownFormatter:
+    """Shared markdown formatter (stateless, safe to reuse across tests).
+
+    Returns:
+        MarkdownFormatter instance
+    """
+    return MarkdownFormatter()
 
 
 @pytest.fixture
@@ -68,3 +150,13 @@ def sample_instagram_url() -> str:
         Instagram post URL
     """
     return "https://www.instagram.com/p/ABC123/"
+
+
+@pytest.fixture
+def make_mock_llm() -> Callable[..., MockLLM]:
+    """Factory for MockLLM instances.
+
+    Returns:
+        Callable taking a list of responses (and optional healthy flag)
+    """
+    return MockLLM
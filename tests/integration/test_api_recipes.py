@@ -5,13 +5,17 @@ are written outside the test environment. Files are automatically cleaned up
 when the temp_vault fixture tears down.
 """
 
+from collections.abc import Callable, Generator
 from pathlib import Path
-from unittest.mock import patch
+from typing import Any
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from recipe_ingest.api import create_app
+from recipe_ingest.api.routes import get_ollama_client, get_settings
+from recipe_ingest.config import LLMConfig, Settings, VaultConfig
 
 # Sample data for mocking LLM responses
 SAMPLE_RECIPE_JSON = {
@@ -35,46 +39,50 @@ SAMPLE_NUTRITION_JSON = {
 
 
 @pytest.fixture
-def client() -> TestClient:
+def app() -> Generator[FastAPI, None, None]:
+    """Create the FastAPI application under test.
+
+    Yields:
+        FastAPI application (dependency overrides cleared on teardown)
+    """
+    app = create_app()
+    yield app
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client(app: FastAPI) -> TestClient:
     """Create test client for API testing.
 
     Returns:
         FastAPI test client
     """
-    app = create_app()
     return TestClient(app)
 
 
 @pytest.fixture
-def mock_llm_client():
-    """Mock LLM client for testing."""
-    with patch("recipe_ingest.core.service.OllamaClient") as MockClient:
-        client_instance = MockClient.return_value
-        client_instance.health_check.return_value = True
-        # Return the same responses for each call (can be called multiple times)
-        client_instance.generate.side_effect = [
-            SAMPLE_RECIPE_JSON,
-            SAMPLE_NUTRITION_JSON,
-        ] * 10  # Provide enough responses for multiple test calls
-        yield client_instance
+def mock_llm_client(app: FastAPI, make_mock_llm: Callable[..., Any]) -> Any:
+    """Mock LLM client injected via FastAPI dependency overrides."""
+    # Alternate recipe/nutrition responses, enough for multiple calls per test
+    client_instance = make_mock_llm([SAMPLE_RECIPE_JSON, SAMPLE_NUTRITION_JSON] * 10)
+    app.dependency_overrides[get_ollama_client] = lambda: client_instance
+    return client_instance
 
 
 @pytest.fixture
-def mock_settings(temp_vault: Path):
+def mock_settings(app: FastAPI, temp_vault: Path) -> Settings:
     """Mock settings with temporary vault.
 
     Args:
+        app: FastAPI application under test
         temp_vault: Temporary vault path
     """
-    with patch("recipe_ingest.api.routes.load_settings") as mock_load:
-        from recipe_ingest.config import LLMConfig, Settings, VaultConfig
-
-        mock_settings = Settings(
-            llm=LLMConfig(endpoint="http://localhost:11434", model="test-model"),
-            vault=VaultConfig(path=temp_vault, recipes_dir="personal/recipes"),
-        )
-        mock_load.return_value = mock_settings
-        yield mock_settings
+    mock_settings = Settings(
+        llm=LLMConfig(endpoint="http://localhost:11434", model="test-model"),
+        vault=VaultConfig(path=temp_vault, recipes_dir="personal/recipes"),
+    )
+    app.dependency_overrides[get_settings] = lambda: mock_settings
+    return mock_settings
 
 
 @pytest.mark.integration
@@ -177,12 +185,6 @@ class TestRecipeIngestionEndpoint:
         self, client: TestClient, mock_llm_client, mock_settings, temp_vault: Path
     ) -> None:
         """Test overwrite succeeds when ingredients match."""
-        # Reset mock to provide fresh responses for second call
-        mock_llm_client.generate.side_effect = [
-            SAMPLE_RECIPE_JSON,
-            SAMPLE_NUTRITION_JSON,
-        ] * 5  # Enough for multiple calls
-
         # Create first recipe
         response1 = client.post(
             "/api/v1/recipes",
@@ -224,27 +226,47 @@ class TestRecipeIngestionEndpoint:
         )
         assert response.status_code == 422
 
-    def test_missing_vault_config_returns_503(self, client: TestClient, mock_llm_client) -> None:
+    def test_missing_vault_config_returns_503(
+        self, app: FastAPI, client: TestClient, mock_llm_client
+    ) -> None:
         """Test missing vault config returns 503."""
-        with patch("recipe_ingest.api.routes.load_settings") as mock_load:
-            from recipe_ingest.config import LLMConfig, Settings
-
-            mock_settings = Settings(
-                llm=LLMConfig(endpoint="http://localhost:11434", model="test-model"),
-                vault=None,  # No vault configured
-            )
-            mock_load.return_value = mock_settings
-
-            response = client.post(
-                "/api/v1/recipes",
-                json={
-                    "input": "Test recipe",
-                    "format": "text",
-                },
-            )
-
-            assert response.status_code == 503
-            assert "temporarily unavailable" in response.json()["detail"].lower()
+        mock_settings = Settings(
+            llm=LLMConfig(endpoint="http://localhost:11434", model="test-model"),
+            vault=None,  # No vault configured
+        )
+        app.dependency_overrides[get_settings] = lambda: mock_settings
+
+        response = client.post(
+            "/api/v1/recipes",
+            json={
+                "input": "Test recipe",
+                "format": "text",
+            },
+        )
+
+        assert response.status_code == 503
+        assert "temporarily unavailable" in response.json()["detail"].lower()
+
+    def test_settings_load_failure_returns_503(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failure while loading settings returns 503 instead of a bare 500."""
+
+        def broken_load_settings() -> Settings:
+            raise RuntimeError("unreadable configuration")
+
+        monkeypatch.setattr("recipe_ingest.api.routes.load_settings", broken_load_settings)
+
+        response = client.post(
+            "/api/v1/recipes",
+            json={
+                "input": "Test recipe",
+                "format": "text",
+            },
+        )
+
+        assert response.status_code == 503
+        assert "configuration" in response.json()["detail"].lower()
 
     def test_processing_time_measured(
         self, client: TestClient, mock_llm_client, mock_settings, temp_vault: Path
@@ -289,82 +311,47 @@ class TestRecipeIngestionEndpoint:
 class TestHealthCheckEndpoint:
     """Tests for health check endpoint."""
 
-    def test_health_check_with_ollama_available(self, client: TestClient, temp_vault: Path) -> None:
+    def test_health_check_with_ollama_available(
+        self, client: TestClient, mock_llm_client, mock_settings
+    ) -> None:
         """Test health check when Ollama is available."""
-        with (
-            patch("recipe_ingest.api.routes.load_settings") as mock_load,
-            patch("recipe_ingest.api.routes.OllamaClient") as MockClient,
-        ):
-            from recipe_ingest.config import LLMConfig, Settings, VaultConfig
-
-            mock_settings = Settings(
-                llm=LLMConfig(endpoint="http://localhost:11434", model="test-model"),
-                vault=VaultConfig(path=temp_vault, recipes_dir="personal/recipes"),
-            )
-            mock_load.return_value = mock_settings
-
-            client_instance = MockClient.return_value
-            client_instance.health_check.return_value = True
-
-            response = client.get("/api/v1/health")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["ollama_connected"] is True
-            assert data["vault_accessible"] is True
-            assert data["status"] == "healthy"
+        response = client.get("/api/v1/health")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ollama_connected"] is True
+        assert data["vault_accessible"] is True
+        assert data["status"] == "healthy"
 
     def test_health_check_with_ollama_unavailable(
-        self, client: TestClient, temp_vault: Path
+        self, client: TestClient, mock_llm_client, mock_settings
     ) -> None:
         """Test health check when Ollama is unavailable."""
-        with (
-            patch("recipe_ingest.api.routes.load_settings") as mock_load,
-            patch("recipe_ingest.api.routes.OllamaClient") as MockClient,
-        ):
-            from recipe_ingest.config import LLMConfig, Settings, VaultConfig
-
-            mock_settings = Settings(
-                llm=LLMConfig(endpoint="http://localhost:11434", model="test-model"),
-                vault=VaultConfig(path=temp_vault, recipes_dir="personal/recipes"),
-            )
-            mock_load.return_value = mock_settings
-
-            client_instance = MockClient.return_value
-            client_instance.health_check.return_value = False
-
-            response = client.get("/api/v1/health")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["ollama_connected"] is False
-            assert data["vault_accessible"] is True
-            assert data["status"] == "unhealthy"
-
-    def test_health_check_with_vault_inaccessible(self, client: TestClient) -> None:
+        mock_llm_client.healthy = False
+
+        response = client.get("/api/v1/health")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ollama_connected"] is False
+        assert data["vault_accessible"] is True
+        assert data["status"] == "unhealthy"
+
+    def test_health_check_with_vault_inaccessible(
+        self, app: FastAPI, client: TestClient, mock_llm_client
+    ) -> None:
         """Test health check when vault is inaccessible."""
-        with (
-            patch("recipe_ingest.api.routes.load_settings") as mock_load,
-            patch("recipe_ingest.api.routes.OllamaClient") as MockClient,
-        ):
-            from pathlib import Path
-
-            from recipe_ingest.config import LLMConfig, Settings, VaultConfig
-
-            # Use non-existent vault path
-            mock_settings = Settings(
-                llm=LLMConfig(endpoint="http://localhost:11434", model="test-model"),
-                vault=VaultConfig(
-                    path=Path("/nonexistent/vault/path"),
-                    recipes_dir="personal/recipes",
-                ),
-            )
-            mock_load.return_value = mock_settings
-
-            client_instance = MockClient.return_value
-            client_instance.health_check.return_value = True
-
-            response = client.get("/api/v1/health")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["ollama_connected"] is True
-            assert data["vault_accessible"] is False
-            assert data["status"] == "unhealthy"
+        # Use non-existent vault path
+        mock_settings = Settings(
+            llm=LLMConfig(endpoint="http://localhost:11434", model="test-model"),
+            vault=VaultConfig(
+                path=Path("/nonexistent/vault/path"),
+                recipes_dir="personal/recipes",
+            ),
+        )
+        app.dependency_overrides[get_settings] = lambda: mock_settings
+
+        response = client.get("/api/v1/health")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ollama_connected"] is True
+        assert data["vault_accessible"] is False
+        assert data["status"] == "unhealthy"
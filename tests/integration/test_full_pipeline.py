@@ -5,71 +5,88 @@ are written outside the test environment. Files are automatically cleaned up
 when the temp_vault fixture tears down.
 """
 
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import pytest
-from pytest_mock import MockerFixture
 
-from recipe_ingest.core import MarkdownFormatter, RecipeExtractor, VaultWriter
-from recipe_ingest.llm import OllamaClient
+from recipe_ingest.core import MarkdownFormatter, RecipeExtractor, VaultWriter, process_recipe
+
+CHOCOLATE_CHIP_EXTRACTION: dict[str, Any] = {
+    "title": "Chocolate Chip Cookies",
+    "prep_time": "15 minutes",
+    "cook_time": "10 minutes",
+    "cuisine": "American",
+    "main_ingredient": "flour",
+    "servings": 60,
+    "ingredients": [
+        "2 1/4 cups all-purpose flour",
+        "1 tsp baking soda",
+        "1 tsp salt",
+        "1 cup butter, softened",
+        "3/4 cup granulated sugar",
+        "3/4 cup packed brown sugar",
+        "2 large eggs",
+        "2 tsp vanilla extract",
+        "2 cups chocolate chips",
+    ],
+    "instructions": [
+        "Preheat oven to 375°F.",
+        "Mix flour, baking soda, and salt in a bowl.",
+        "Beat butter and sugars until creamy.",
+        "Add eggs and vanilla, beat well.",
+        "Gradually mix in flour mixture.",
+        "Stir in chocolate chips.",
+        "Drop by rounded tablespoon onto baking sheets.",
+        "Bake 9-11 minutes until golden brown.",
+        "Cool on baking sheet for 2 minutes.",
+        "Transfer to wire rack.",
+    ],
+    "notes": None,
+}
+
+CHOCOLATE_CHIP_NUTRITION: dict[str, Any] = {
+    "calories_per_serving": 120.0,
+    "carbs_grams": 15.0,
+    "protein_grams": 2.0,
+    "fat_grams": 6.0,
+}
 
 
 @pytest.mark.integration
 class TestFullPipeline:
     """Integration tests for complete recipe ingestion flow."""
 
+    @pytest.mark.parametrize(
+        ("responses", "expected_calls"),
+        [
+            pytest.param(
+                [CHOCOLATE_CHIP_EXTRACTION, CHOCOLATE_CHIP_NUTRITION], 2, id="separate-nutrition"
+            ),
+            pytest.param(
+                [{**CHOCOLATE_CHIP_EXTRACTION, **CHOCOLATE_CHIP_NUTRITION}], 1, id="combined"
+            ),
+        ],
+    )
     def test_full_pipeline_with_mocked_llm(
-        self, temp_vault: Path, sample_recipe_text: str, mocker: MockerFixture
+        self,
+        temp_vault: Path,
+        sample_recipe_text: str,
+        make_mock_llm: Callable[..., Any],
+        formatter: MarkdownFormatter,
+        responses: list[dict[str, Any]],
+        expected_calls: int,
     ) -> None:
-        """Test complete pipeline from text input to vault file."""
-        # Mock LLM responses
-        mock_client = mocker.Mock(spec=OllamaClient)
-        mock_client.generate.side_effect = [
-            # Recipe extraction response
-            {
-                "title": "Chocolate Chip Cookies",
-                "prep_time": "15 minutes",
-                "cook_time": "10 minutes",
-                "cuisine": "American",
-                "main_ingredient": "flour",
-                "servings": 60,
-                "ingredients": [
-                    "2 1/4 cups all-purpose flour",
-                    "1 tsp baking soda",
-                    "1 tsp salt",
-                    "1 cup butter, softened",
-                    "3/4 cup granulated sugar",
-                    "3/4 cup packed brown sugar",
-                    "2 large eggs",
-                    "2 tsp vanilla extract",
-                    "2 cups chocolate chips",
-                ],
-                "instructions": [
-                    "Preheat oven to 375°F.",
-                    "Mix flour, baking soda, and salt in a bowl.",
-                    "Beat butter and sugars until creamy.",
-                    "Add eggs and vanilla, beat well.",
-                    "Gradually mix in flour mixture.",
-                    "Stir in chocolate chips.",
-                    "Drop by rounded tablespoon onto baking sheets.",
-                    "Bake 9-11 minutes until golden brown.",
-                    "Cool on baking sheet for 2 minutes.",
-                    "Transfer to wire rack.",
-                ],
-                "notes": None,
-            },
-            # Nutrition calculation response
-            {
-                "calories_per_serving": 120.0,
-                "carbs_grams": 15.0,
-                "protein_grams": 2.0,
-                "fat_grams": 6.0,
-            },
-        ]
+        """Test complete pipeline from text input to vault file.
+
+        The combined variant returns nutrition alongside the extraction, so the
+        extractor skips the separate nutrition call.
+        """
+        mock_client = make_mock_llm(responses)
 
         # Initialize components
         extractor = RecipeExtractor(llm_client=mock_client)
-        formatter = MarkdownFormatter()
         writer = VaultWriter(vault_path=temp_vault)
 
         # Step 1: Extract
@@ -90,56 +107,64 @@ class TestFullPipeline:
         assert file_path.exists()
         assert file_path.name == "Chocolate Chip Cookies.md"
 
-        # Verify file contents
-        content = file_path.read_text()
-        assert "title: Chocolate Chip Cookies" in content
-        assert "servings: 60" in content
-        assert "calories_per_serving: 120.0" in content
-        assert "2 1/4 cups all-purpose flour" in content
+        # Verify file contents (ASCII needles, so match on raw bytes without decoding)
+        content = file_path.read_bytes()
+        for needle in (
+            b"title: Chocolate Chip Cookies",
+            b"servings: 60",
+            b"calories_per_serving: 120.0",
+            b"2 1/4 cups all-purpose flour",
+        ):
+            assert needle in content
 
         # Verify LLM was called correct number of times
-        assert mock_client.generate.call_count == 2
+        assert mock_client.calls == expected_calls
 
         # Explicit cleanup - temp_vault auto-cleans, but being explicit makes intent clear
         # All files created in temp_vault will be automatically removed when fixture tears down
 
-    def test_duplicate_detection_in_pipeline(self, temp_vault: Path, mocker: MockerFixture) -> None:
+    def test_duplicate_detection_in_pipeline(
+        self,
+        temp_vault: Path,
+        make_mock_llm: Callable[..., Any],
+        formatter: MarkdownFormatter,
+    ) -> None:
         """Test that duplicate detection works in full pipeline."""
         # Mock LLM responses
-        mock_client = mocker.Mock(spec=OllamaClient)
-        mock_client.generate.side_effect = [
-            # First recipe extraction
-            {
-                "title": "Duplicate Recipe",
-                "ingredients": ["ingredient"],
-                "instructions": ["instruction"],
-                "servings": 1,
-            },
-            # First nutrition
-            {
-                "calories_per_serving": 100.0,
-                "carbs_grams": 10.0,
-                "protein_grams": 5.0,
-                "fat_grams": 3.0,
-            },
-            # Second recipe extraction (same title)
-            {
-                "title": "Duplicate Recipe",
-                "ingredients": ["different ingredient"],
-                "instructions": ["different instruction"],
-                "servings": 1,
-            },
-            # Second nutrition
-            {
-                "calories_per_serving": 100.0,
-                "carbs_grams": 10.0,
-                "protein_grams": 5.0,
-                "fat_grams": 3.0,
-            },
-        ]
+        mock_client = make_mock_llm(
+            [
+                # First recipe extraction
+                {
+                    "title": "Duplicate Recipe",
+                    "ingredients": ["ingredient"],
+                    "instructions": ["instruction"],
+                    "servings": 1,
+                },
+                # First nutrition
+                {
+                    "calories_per_serving": 100.0,
+                    "carbs_grams": 10.0,
+                    "protein_grams": 5.0,
+                    "fat_grams": 3.0,
+                },
+                # Second recipe extraction (same title)
+                {
+                    "title": "Duplicate Recipe",
+                    "ingredients": ["different ingredient"],
+                    "instructions": ["different instruction"],
+                    "servings": 1,
+                },
+                # Second nutrition
+                {
+                    "calories_per_serving": 100.0,
+                    "carbs_grams": 10.0,
+                    "protein_grams": 5.0,
+                    "fat_grams": 3.0,
+                },
+            ]
+        )
 
         extractor = RecipeExtractor(llm_client=mock_client)
-        formatter = MarkdownFormatter()
         writer = VaultWriter(vault_path=temp_vault)
 
         # First recipe - should succeed
@@ -148,12 +173,12 @@ class TestFullPipeline:
         file_path = writer.write(recipe1.metadata.title, markdown1)
         assert file_path.exists()
 
-        # Second recipe with same title - should fail without overwrite
+        # Second recipe with same title - detected as a duplicate before writing
+        # (write() raising FileExistsError is covered by the VaultWriter unit tests)
         recipe2 = extractor.extract("Second recipe text")
         markdown2 = formatter.format(recipe2)
-
-        with pytest.raises(FileExistsError):
-            writer.write(recipe2.metadata.title, markdown2, overwrite=False)
+        assert writer.check_duplicate(recipe2.metadata.title)
+        assert writer.get_file_path(recipe2.metadata.title) == file_path
 
         # With overwrite flag - should succeed
         file_path = writer.write(recipe2.metadata.title, markdown2, overwrite=True)
@@ -163,3 +188,44 @@ class TestFullPipeline:
 
         # Explicit cleanup - temp_vault auto-cleans, but being explicit makes intent clear
         # All files created in temp_vault will be automatically removed when fixture tears down
+
+    def test_skip_health_check_with_unhealthy_llm(
+        self, make_mock_llm: Callable[..., Any], sample_recipe_text: str
+    ) -> None:
+        """Test skip_health_check=True proceeds even when the health check would fail."""
+        mock_client = make_mock_llm(
+            [CHOCOLATE_CHIP_EXTRACTION, CHOCOLATE_CHIP_NUTRITION], healthy=False
+        )
+
+        result = process_recipe(
+            input_text=sample_recipe_text,
+            vault_path=None,
+            llm_endpoint="http://localhost:11434",
+            llm_model="llama2",
+            preview_only=True,
+            skip_health_check=True,
+            llm_client=mock_client,
+        )
+
+        assert result.recipe.metadata.title == "Chocolate Chip Cookies"
+        assert mock_client.calls == 2
+
+    def test_health_check_failure_raises_connection_error(
+        self, make_mock_llm: Callable[..., Any], sample_recipe_text: str
+    ) -> None:
+        """Test an unhealthy LLM raises ConnectionError before any extraction."""
+        mock_client = make_mock_llm(
+            [CHOCOLATE_CHIP_EXTRACTION, CHOCOLATE_CHIP_NUTRITION], healthy=False
+        )
+
+        with pytest.raises(ConnectionError, match="Cannot connect to Ollama"):
+            process_recipe(
+                input_text=sample_recipe_text,
+                vault_path=None,
+                llm_endpoint="http://localhost:11434",
+                llm_model="llama2",
+                preview_only=True,
+                skip_health_check=False,
+                llm_client=mock_client,
+            )
+        assert mock_client.calls == 0
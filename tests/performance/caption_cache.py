@@ -0,0 +1,69 @@
+"""On-disk cache of Instagram captions for the reference-recipe scripts.
+
+Fetching a caption hits instagram.com (slow and rate limited), so captions are
+cached per post under reference_recipes/.cache and reused for a week.
+"""
+
+import functools
+import logging
+import re
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Cache location and freshness window
+CACHE_DIR = Path(__file__).parent / "reference_recipes" / ".cache"
+CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+
+def _cache_path(url: str) -> Path:
+    """Get the cache file path for an Instagram URL.
+
+    Args:
+        url: Instagram post URL
+
+    Returns:
+        Path to the cached caption file (keyed by the post shortcode)
+    """
+    shortcode = url.split("?", 1)[0].rstrip("/").rsplit("/", 1)[-1]
+    slug = re.sub(r"[^A-Za-z0-9_-]+", "_", shortcode) or "caption"
+    return CACHE_DIR / f"{slug}.txt"
+
+
+@functools.cache
+def get_instagram_caption_cached(url: str) -> str:
+    """Get an Instagram caption, using the on-disk cache when it is fresh.
+
+    Args:
+        url: Instagram post URL
+
+    Returns:
+        Caption text
+
+    Raises:
+        ValueError: If the URL is invalid or the post has no caption
+        ConnectionError: If Instagram cannot be reached
+    """
+    cache_path = _cache_path(url)
+    if cache_path.exists() and time.time() - cache_path.stat().st_mtime < CACHE_MAX_AGE_SECONDS:
+        logger.info(f"Using cached Instagram caption: {cache_path}")
+        return cache_path.read_text(encoding="utf-8")
+
+    from recipe_ingest.parsers.instagram import InstagramParser
+
+    caption = InstagramParser().parse(url)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(caption, encoding="utf-8")
+    logger.info(f"Cached Instagram caption to {cache_path}")
+    return caption
+
+
+def clear_cached_caption(url: str) -> None:
+    """Drop the cached caption for an Instagram URL so the next lookup refetches it.
+
+    Args:
+        url: Instagram post URL
+    """
+    get_instagram_caption_cached.cache_clear()
+    _cache_path(url).unlink(missing_ok=True)
@@ -0,0 +1,103 @@
+"""Shared configuration for the Ollama benchmark tests.
+
+Model selection is read from the environment (and .env) when tests are collected,
+not when the benchmark module is imported, so a missing OLLAMA_MODELS skips the
+benchmarks instead of aborting collection of the whole run. Pass --model-set one
+or more times to benchmark explicit model lists instead of OLLAMA_MODELS.
+"""
+
+import logging
+import os
+
+import pytest
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_models(models_str: str | None = None) -> list[str]:
+    """Resolve the models to benchmark from OLLAMA_MODELS and friends.
+
+    The environment is read on every call, so a monkeypatched or re-exported
+    variable takes effect without restarting the interpreter.
+    OLLAMA_MODELS_LIMIT keeps only the first N models. OLLAMA_PRIMARY_MODEL moves
+    that model to the front, or tests it alone if it is not in the list.
+
+    Args:
+        models_str: Comma-separated model names; defaults to OLLAMA_MODELS
+
+    Returns:
+        Model names in test order (empty if no models are configured)
+    """
+    if models_str is None:
+        models_str = os.environ.get("OLLAMA_MODELS", "")
+    all_models = [model.strip() for model in models_str.split(",") if model.strip()]
+    if not all_models:
+        logger.warning(
+            "OLLAMA_MODELS not found in environment. "
+            "Please create a .env file from .env.example and set OLLAMA_MODELS."
+        )
+
+    # Limit models for faster testing (0 means no limit)
+    models_limit = int(os.environ.get("OLLAMA_MODELS_LIMIT", "0"))
+    if models_limit > 0:
+        models = all_models[:models_limit]
+        logger.info(f"Limited to first {models_limit} models: {models}")
+    else:
+        models = all_models
+
+    # Primary model is used even if it is not in the configured list
+    primary_model = os.environ.get("OLLAMA_PRIMARY_MODEL")
+    if primary_model:
+        if primary_model in all_models:
+            models = [primary_model] + [m for m in models if m != primary_model]
+            logger.info(f"Using primary model '{primary_model}' (found in OLLAMA_MODELS)")
+        else:
+            models = [primary_model]
+            logger.info(
+                f"Using primary model '{primary_model}' "
+                f"(not in OLLAMA_MODELS, testing this model only)"
+            )
+
+    return models
+
+
+def _model_sets(config: pytest.Config) -> list[list[str]]:
+    """Resolve each --model-set option, falling back to OLLAMA_MODELS."""
+    model_sets = [resolve_models(s) for s in config.getoption("model_set")]
+    return [models for models in model_sets if models] or [resolve_models()]
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Load environment variables from the .env file before collection."""
+    load_dotenv()
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize benchmark tests over the configured models.
+
+    Tests taking ``model`` run once per model across all model sets. Tests taking
+    ``ollama_models`` run once per model set when several sets are given;
+    otherwise they use the ollama_models fixture below.
+    """
+    model_sets = _model_sets(metafunc.config)
+    if "model" in metafunc.fixturenames:
+        models = list(dict.fromkeys(m for models in model_sets for m in models))
+        metafunc.parametrize("model", models)
+    if "ollama_models" in metafunc.fixturenames and len(model_sets) > 1:
+        metafunc.parametrize(
+            "ollama_models", model_sets, ids=[",".join(models) for models in model_sets]
+        )
+
+
+@pytest.fixture(scope="session")
+def ollama_models(pytestconfig: pytest.Config) -> list[str]:
+    """Models configured for benchmarking, in test order.
+
+    Raises:
+        pytest.Skip: If no models are configured
+    """
+    models = _model_sets(pytestconfig)[0]
+    if not models:
+        pytest.skip("No models configured for testing (set OLLAMA_MODELS in .env)")
+    return models
@@ -5,29 +5,22 @@ This script helps you create a reference recipe manually by:
 2. Providing a template JSON structure
 3. Allowing you to manually enter the correct recipe data
 
-Usage:
+Usage (from the project root, with recipe_ingest importable):
     python -m tests.performance.create_reference_recipe_manual
+    python -m tests.performance.create_reference_recipe_manual --from-json - < recipe.json
 """
 
 import json
 import logging
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
 
-# Add project root to Python path for imports
-project_root = Path(__file__).parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+from pydantic import HttpUrl, ValidationError
 
-from pydantic import HttpUrl, ValidationError  # noqa: E402
-
-from recipe_ingest.models.recipe import (
-    MacroNutrients,
-    Recipe,
-    RecipeMetadata,
-)  # noqa: E402
-from recipe_ingest.parsers.instagram import InstagramParser  # noqa: E402
+from recipe_ingest.models.recipe import MacroNutrients, Recipe, RecipeMetadata
+from tests.performance.caption_cache import get_instagram_caption_cached
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -39,12 +32,16 @@ TEST_INSTAGRAM_URL = "https://www.instagram.com/reel/DRYdlekE-Yb"
 REFERENCE_RECIPE_DIR = Path(__file__).parent / "reference_recipes"
 REFERENCE_RECIPE_PATH = REFERENCE_RECIPE_DIR / "DRYdlekE-Yb.json"
 
+# Creation timestamp captured once per run so template and recipe agree.
+# Set REFERENCE_RECIPE_CREATED (ISO 8601) to pin it for reproducible output.
+_created_override = os.getenv("REFERENCE_RECIPE_CREATED")
+_NOW = datetime.fromisoformat(_created_override) if _created_override else datetime.now()
+
 
 def get_instagram_caption() -> str:
     """Extract Instagram caption for reference."""
     try:
-        instagram_parser = InstagramParser()
-        caption = instagram_parser.parse(TEST_INSTAGRAM_URL)
+        caption = get_instagram_caption_cached(TEST_INSTAGRAM_URL)
         logger.info(f"Extracted Instagram caption ({len(caption)} characters)")
         return caption
     except Exception as e:
@@ -70,7 +67,7 @@ def create_template_json() -> dict:
                 "fat": 0.0,  # e.g., 2.0
             },
             "servings": None,  # e.g., 9
-            "created": datetime.now().isoformat(),
+            "created": _NOW.isoformat(),
         },
         "ingredients": [
             # Add ingredients here, e.g.:
@@ -185,7 +182,7 @@ def create_reference_interactive() -> Recipe:
             calories_per_serving=calories,
             macros=macros,
             servings=servings,
-            created=datetime.now(),
+            created=_NOW,
         )
 
         recipe = Recipe(
@@ -228,14 +225,33 @@ def load_and_validate_template() -> Recipe:
         print("Run this script without --from-template to create a template first")
         sys.exit(1)
 
-    with open(template_path, encoding="utf-8") as f:
-        data = json.load(f)
+    return _validate_recipe_json(template_path.read_bytes(), "template")
+
+
+def load_and_validate_json(source: str) -> Recipe:
+    """Load and validate a complete recipe JSON document from a file or stdin.
+
+    Args:
+        source: Path to a JSON file, or "-" to read from stdin
+    """
+    if source == "-":
+        return _validate_recipe_json(sys.stdin.buffer.read(), "stdin")
+
+    json_path = Path(source)
+    if not json_path.exists():
+        print(f"❌ JSON file not found: {json_path}")
+        sys.exit(1)
+
+    return _validate_recipe_json(json_path.read_bytes(), str(json_path))
+
 
+def _validate_recipe_json(data: bytes, source_name: str) -> Recipe:
+    """Validate raw recipe JSON, exiting with a message on failure."""
     try:
-        recipe = Recipe.model_validate(data)
-        return recipe
+        # Validate straight from JSON bytes in pydantic-core (no intermediate dict)
+        return Recipe.model_validate_json(data)
     except ValidationError as e:
-        print(f"❌ Validation error in template: {e}")
+        print(f"❌ Validation error in {source_name}: {e}")
         sys.exit(1)
 
 
@@ -256,6 +272,11 @@ def main() -> None:
         action="store_true",
         help="Load and validate template JSON file, then save as reference",
     )
+    parser.add_argument(
+        "--from-json",
+        metavar="PATH",
+        help="Load and validate a complete recipe JSON file ('-' for stdin), then save it",
+    )
     parser.add_argument(
         "--interactive",
         action="store_true",
@@ -268,14 +289,19 @@ def main() -> None:
         create_reference_from_template()
         return
 
-    # Default to interactive if not loading from template
-    recipe = load_and_validate_template() if args.from_template else create_reference_interactive()
+    # Default to interactive if not loading from template or JSON
+    if args.from_json:
+        recipe = load_and_validate_json(args.from_json)
+    elif args.from_template:
+        recipe = load_and_validate_template()
+    else:
+        recipe = create_reference_interactive()
 
     # Save reference recipe
     REFERENCE_RECIPE_DIR.mkdir(parents=True, exist_ok=True)
 
-    with open(REFERENCE_RECIPE_PATH, "w", encoding="utf-8") as f:
-        json.dump(recipe.model_dump(mode="json"), f, indent=2, ensure_ascii=False)
+    # Serialize in pydantic-core directly rather than dumping to a dict first
+    REFERENCE_RECIPE_PATH.write_text(recipe.model_dump_json(indent=2), encoding="utf-8")
 
     print("\n" + "=" * 80)
     print("✅ REFERENCE RECIPE CREATED")
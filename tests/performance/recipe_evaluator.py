@@ -1,19 +1,35 @@
 """Recipe evaluation utilities for comparing model outputs against reference recipes."""
 
-import json
 import logging
+import math
+import multiprocessing
+import sys
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+from pydantic import ValidationError
+
 from recipe_ingest.models.recipe import Recipe
 
 logger = logging.getLogger(__name__)
 
+# Free-text metadata fields compared by similarity in evaluate_recipe
+_METADATA_TEXT_FIELDS = ("prep_time", "cook_time", "cuisine", "main_ingredient")
+
 
+@lru_cache(maxsize=4096)
 def similarity_score(str1: str, str2: str) -> float:
     """Calculate similarity score between two strings (0-1).
 
+    Cached, since benchmarks score every model against the same reference title,
+    metadata and instruction strings. Arguments are not reordered for the cache
+    key: SequenceMatcher.ratio() is not symmetric.
+
     Args:
         str1: First string
         str2: Second string
@@ -25,24 +41,121 @@ def similarity_score(str1: str, str2: str) -> float:
         return 1.0
     if not str1 or not str2:
         return 0.0
-    return SequenceMatcher(None, str1.lower().strip(), str2.lower().strip()).ratio()
+    a = str1.lower().strip()
+    b = str2.lower().strip()
+    # Exact matches are common when a model copies the reference value verbatim
+    if a == b:
+        return 1.0
+    return _ratio(a, b)
+
+
+def _ratio(a: str, b: str) -> float:
+    """Similarity ratio of two already-normalized strings (0-1).
+
+    Single scoring kernel for the module, so callers holding normalized text
+    skip the lower/strip in similarity_score.
+    """
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _ratio_above(matcher: SequenceMatcher, a: str, threshold: float) -> float:
+    """Similarity ratio of a normalized string against the matcher's seq2 (0-1).
+
+    The matcher holds the reference string as seq2, so its b2j index and
+    character counts are built once and reused for every string compared to it.
+    Checks cheap upper bounds (length-only, then character bag) before running
+    the full ratio() computation.
+
+    Args:
+        matcher: SequenceMatcher with the reference string set as seq2
+        a: Normalized string to compare
+        threshold: Minimum score of interest (0-1)
+
+    Returns:
+        Similarity score, or 0.0 when it is certainly below threshold
+    """
+    b = matcher.b
+    if a == b:
+        return 1.0
+    # Length-only bound (same as real_quick_ratio()), checked before touching the
+    # matcher: ratio = 2*M / (len(a) + len(b)) with M <= min(len(a), len(b))
+    len_a = len(a)
+    len_b = len(b)
+    if 2.0 * min(len_a, len_b) / (len_a + len_b) < threshold:
+        return 0.0
+    matcher.set_seq1(a)
+    if matcher.quick_ratio() < threshold:
+        return 0.0
+    return matcher.ratio()
+
+
+def token_jaccard(str1: str, str2: str) -> float:
+    """Calculate token-set Jaccard similarity between two strings (0-1).
+
+    Word order is ignored, so "2 cups flour, sifted" and "sifted flour, 2 cups"
+    score highly. Cheaper than similarity_score, but coarser on near-miss tokens.
+
+    Args:
+        str1: First string
+        str2: Second string
+
+    Returns:
+        Similarity score between 0 and 1
+    """
+    tokens1 = _tokens(str1)
+    tokens2 = _tokens(str2)
+    if not tokens1 and not tokens2:
+        return 1.0
+    return len(tokens1 & tokens2) / len(tokens1 | tokens2)
+
 
+@lru_cache(maxsize=8192)
+def _tokens(text: str) -> frozenset[str]:
+    """Lowercased word set of a string."""
+    return frozenset(text.lower().split())
 
+
+@lru_cache(maxsize=8192)
 def normalize_ingredient(ingredient: str) -> str:
     """Normalize ingredient string for comparison.
 
+    Cached per string, so a reference recipe evaluated against many predictions
+    is only normalized once.
+
     Args:
         ingredient: Ingredient string
 
     Returns:
         Normalized ingredient string
     """
-    # Remove extra whitespace, convert to lowercase
-    return " ".join(ingredient.lower().strip().split())
+    # Remove extra whitespace (split() also drops leading/trailing), convert to lowercase.
+    # Interned so repeated ingredients share one object and compare by identity first.
+    return sys.intern(" ".join(ingredient.lower().split()))
+
+
+def _normalize_many(ingredients: list[str]) -> list[str]:
+    """Normalize a list of ingredient strings."""
+    return [normalize_ingredient(ing) for ing in ingredients]
+
+
+def _empty_metrics(total_predicted: int, total_reference: int) -> dict[str, Any]:
+    """Zero-score metrics for when either side has nothing to compare."""
+    return {
+        "precision": 0.0,
+        "recall": 0.0,
+        "f1": 0.0,
+        "matched_count": 0,
+        "total_predicted": total_predicted,
+        "total_reference": total_reference,
+    }
 
 
 def compare_ingredients(
-    predicted: list[str], reference: list[str], threshold: float = 0.8
+    predicted: list[str],
+    reference: list[str],
+    threshold: float = 0.8,
+    scorer: Callable[[str, str], float] | None = None,
+    optimal: bool = False,
 ) -> dict[str, Any]:
     """Compare predicted ingredients against reference.
 
@@ -50,54 +163,93 @@ def compare_ingredients(
         predicted: Predicted ingredient list
         reference: Reference ingredient list
         threshold: Similarity threshold for matching (0-1)
+        scorer: Optional similarity function for normalized ingredient pairs
+            (e.g. token_jaccard); defaults to difflib's sequence ratio
+        optimal: If True, choose the matching that maximizes total similarity
+            (Hungarian algorithm) instead of greedily matching in list order
 
     Returns:
         Dictionary with accuracy metrics
     """
-    if not reference:
-        return {
-            "precision": 0.0,
-            "recall": 0.0,
-            "f1": 0.0,
-            "matched_count": 0,
-            "total_predicted": len(predicted),
-            "total_reference": 0,
-        }
-
-    if not predicted:
-        return {
-            "precision": 0.0,
-            "recall": 0.0,
-            "f1": 0.0,
-            "matched_count": 0,
-            "total_predicted": 0,
-            "total_reference": len(reference),
-        }
+    return _compare_ingredients(predicted, reference, threshold, scorer, optimal)
 
-    # Normalize ingredients
-    pred_normalized = [normalize_ingredient(ing) for ing in predicted]
-    ref_normalized = [normalize_ingredient(ing) for ing in reference]
 
-    # Find matches using similarity
-    matched_indices = set()
-    matches = []
+def _reference_matchers(reference: list[str]) -> list[SequenceMatcher]:
+    """Build a SequenceMatcher (as seq2) for each normalized reference ingredient.
 
-    for i, pred_ing in enumerate(pred_normalized):
-        best_match_idx = -1
-        best_score = 0.0
+    Repeated ingredients share one matcher.
+    """
+    normalized = _normalize_many(reference)
+    matchers: dict[str, SequenceMatcher] = {}
+    for ref in normalized:
+        if ref not in matchers:
+            matchers[ref] = SequenceMatcher(None, "", ref, autojunk=False)
+    return [matchers[ref] for ref in normalized]
+
+
+def _memoize_pairs(
+    score: Callable[[int, int], float], rows: list[str], cols: list[str]
+) -> Callable[[int, int], float]:
+    """Wrap score(i, j) so each distinct (rows[i], cols[j]) string pair is scored once."""
+    cache: dict[tuple[str, str], float] = {}
+
+    def memoized(i: int, j: int) -> float:
+        key = (rows[i], cols[j])
+        if key not in cache:
+            cache[key] = score(i, j)
+        return cache[key]
+
+    return memoized
+
+
+def _compare_ingredients(
+    predicted: list[str],
+    reference: list[str],
+    threshold: float = 0.8,
+    scorer: Callable[[str, str], float] | None = None,
+    optimal: bool = False,
+    ref_matchers: list[SequenceMatcher] | None = None,
+) -> dict[str, Any]:
+    """compare_ingredients, optionally reusing matchers prebuilt for the reference.
 
-        for j, ref_ing in enumerate(ref_normalized):
-            if j in matched_indices:
-                continue
+    Args:
+        ref_matchers: Result of _reference_matchers(reference), to skip rebuilding
+            the reference's difflib indexes on every call
+    """
+    if not reference or not predicted:
+        return _empty_metrics(len(predicted), len(reference))
 
-            score = similarity_score(pred_ing, ref_ing)
-            if score > best_score:
-                best_score = score
-                best_match_idx = j
+    # Normalize ingredients
+    pred_normalized = _normalize_many(predicted)
+    ref_normalized = _normalize_many(reference)
+
+    # Score prediction i against reference j. The default scorer returns 0.0 for
+    # pairs that cannot reach the threshold, which never changes the assignment
+    # since they could not match anyway.
+    if scorer is None:
+        if ref_matchers is None:
+            ref_matchers = _reference_matchers(reference)
+        matchers = ref_matchers
+
+        def score(i: int, j: int) -> float:
+            return _ratio_above(matchers[j], pred_normalized[i], threshold)
+
+    else:
+
+        def score(i: int, j: int) -> float:
+            return scorer(pred_normalized[i], ref_normalized[j])
+
+    # Identical strings score identically, so when either side repeats an ingredient
+    # only score each distinct pair once
+    distinct = len(set(pred_normalized)) + len(set(ref_normalized))
+    pair_score = (
+        _memoize_pairs(score, pred_normalized, ref_normalized)
+        if distinct < len(pred_normalized) + len(ref_normalized)
+        else score
+    )
 
-        if best_score >= threshold and best_match_idx >= 0:
-            matched_indices.add(best_match_idx)
-            matches.append((i, best_match_idx, best_score))
+    assign = _optimal_assign if optimal else _greedy_assign
+    matches = assign(len(pred_normalized), len(ref_normalized), pair_score, threshold)
 
     matched_count = len(matches)
     precision = matched_count / len(predicted) if predicted else 0.0
@@ -115,6 +267,118 @@ def compare_ingredients(
     }
 
 
+def _greedy_assign(
+    n_rows: int, n_cols: int, score: Callable[[int, int], float], threshold: float
+) -> list[tuple[int, int, float]]:
+    """Greedily match each row, in order, to its best still-unmatched column.
+
+    Scores are computed lazily, only for columns that are still free. max() keeps
+    the first of equally scored columns.
+
+    Args:
+        n_rows: Number of rows (predictions)
+        n_cols: Number of columns (references)
+        score: Similarity of row i and column j (0-1)
+        threshold: Minimum score for a match
+
+    Returns:
+        (row, column, score) tuples for matched pairs
+    """
+    remaining = list(range(n_cols))
+    matches = []
+
+    for i in range(n_rows):
+        if not remaining:
+            break
+
+        best_score, best_j = max(((score(i, j), j) for j in remaining), key=itemgetter(0))
+
+        if best_score >= threshold and best_score > 0.0:
+            remaining.remove(best_j)
+            matches.append((i, best_j, best_score))
+
+    return matches
+
+
+def _optimal_assign(
+    n_rows: int, n_cols: int, score: Callable[[int, int], float], threshold: float
+) -> list[tuple[int, int, float]]:
+    """Match rows to columns maximizing the total score of above-threshold pairs.
+
+    Hungarian algorithm (O(n^2 * m)) on the full score matrix, with scores below
+    threshold counted as 0 since they can never form a match.
+
+    Args:
+        n_rows: Number of rows (predictions)
+        n_cols: Number of columns (references)
+        score: Similarity of row i and column j (0-1)
+        threshold: Minimum score for a match
+
+    Returns:
+        (row, column, score) tuples for matched pairs, ordered by row
+    """
+    weights = [
+        [w if (w := score(i, j)) >= threshold else 0.0 for j in range(n_cols)]
+        for i in range(n_rows)
+    ]
+
+    # The solver below assigns every row, so it needs rows <= columns
+    transposed = n_rows > n_cols
+    if transposed:
+        weights = [list(col) for col in zip(*weights, strict=True)]
+    n, m = len(weights), len(weights[0])
+
+    # Potentials u/v, column owners p (1-based rows, 0 = free) and augmenting path
+    inf = float("inf")
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    p = [0] * (m + 1)
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            delta = inf
+            j1 = 0
+            row = weights[i0 - 1]
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = -row[j - 1] - u[i0] - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    matches = []
+    for j in range(1, m + 1):
+        if p[j]:
+            i = p[j] - 1
+            w = weights[i][j - 1]
+            if w >= threshold and w > 0.0:
+                matches.append((j - 1, i, w) if transposed else (i, j - 1, w))
+    matches.sort()
+    return matches
+
+
 def compare_instructions(
     predicted: list[str], reference: list[str], threshold: float = 0.7
 ) -> dict[str, Any]:
@@ -128,49 +392,30 @@ def compare_instructions(
     Returns:
         Dictionary with accuracy metrics
     """
-    if not reference:
-        return {
-            "precision": 0.0,
-            "recall": 0.0,
-            "f1": 0.0,
-            "matched_count": 0,
-            "total_predicted": len(predicted),
-            "total_reference": 0,
-            "avg_similarity": 0.0,
-        }
-
-    if not predicted:
-        return {
-            "precision": 0.0,
-            "recall": 0.0,
-            "f1": 0.0,
-            "matched_count": 0,
-            "total_predicted": 0,
-            "total_reference": len(reference),
-            "avg_similarity": 0.0,
-        }
-
-    # For instructions, we compare order-aware (sequence similarity)
-    # Calculate similarity for each step
-    similarities = []
-    max_len = max(len(predicted), len(reference))
-    min_len = min(len(predicted), len(reference))
+    if not reference or not predicted:
+        return {**_empty_metrics(len(predicted), len(reference)), "avg_similarity": 0.0}
 
-    for i in range(min_len):
-        sim = similarity_score(predicted[i], reference[i])
+    # For instructions, we compare order-aware (sequence similarity).
+    # One pass scores each aligned step (zip stops at the shorter list) and counts
+    # matches above threshold; the total uses math.fsum(), which is more exact
+    # than accumulating the floats in the loop.
+    similarities = []
+    matched_count = 0
+    for pred, ref in zip(predicted, reference, strict=False):
+        sim = similarity_score(pred, ref)
         similarities.append(sim)
+        matched_count += sim >= threshold
+
+    max_len = max(len(predicted), len(reference))
+    min_len = len(similarities)
 
     # Penalize for length differences
-    length_penalty = min_len / max_len if max_len > 0 else 0.0
+    length_penalty = min_len / max_len
 
-    avg_similarity = sum(similarities) / len(similarities) if similarities else 0.0
+    avg_similarity = math.fsum(similarities) / min_len
     # Weighted average considering length
     weighted_similarity = avg_similarity * length_penalty
 
-    # Count matches above threshold
-    matches = [s for s in similarities if s >= threshold]
-    matched_count = len(matches)
-
     precision = matched_count / len(predicted) if predicted else 0.0
     recall = matched_count / len(reference) if reference else 0.0
     f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0.0
@@ -197,6 +442,34 @@ def evaluate_recipe(predicted: Recipe, reference: Recipe) -> dict[str, Any]:
     Returns:
         Dictionary with comprehensive accuracy metrics
     """
+    return _evaluate_recipe(predicted, reference)
+
+
+def make_evaluator(reference: Recipe) -> Callable[[Recipe], dict[str, Any]]:
+    """Build an evaluate_recipe equivalent specialized for one reference recipe.
+
+    The reference's normalized ingredients and difflib indexes are built once and
+    reused for every prediction, which pays off when sweeping many models against
+    the same reference. The returned function is not safe to share across threads.
+
+    Args:
+        reference: Reference (gold standard) recipe
+
+    Returns:
+        Function taking a predicted recipe and returning evaluate_recipe's metrics
+    """
+    ref_matchers = _reference_matchers(reference.ingredients)
+
+    def evaluate(predicted: Recipe) -> dict[str, Any]:
+        return _evaluate_recipe(predicted, reference, ref_matchers)
+
+    return evaluate
+
+
+def _evaluate_recipe(
+    predicted: Recipe, reference: Recipe, ref_matchers: list[SequenceMatcher] | None = None
+) -> dict[str, Any]:
+    """evaluate_recipe, optionally reusing matchers prebuilt for the reference ingredients."""
     metrics = {}
 
     # Title similarity
@@ -205,48 +478,26 @@ def evaluate_recipe(predicted: Recipe, reference: Recipe) -> dict[str, Any]:
     )
 
     # Ingredients comparison
-    metrics["ingredients"] = compare_ingredients(predicted.ingredients, reference.ingredients)
+    metrics["ingredients"] = _compare_ingredients(
+        predicted.ingredients, reference.ingredients, ref_matchers=ref_matchers
+    )
 
     # Instructions comparison
     metrics["instructions"] = compare_instructions(predicted.instructions, reference.instructions)
 
-    # Metadata fields
-    metadata_metrics = {}
-    metadata_metrics["prep_time_match"] = (
-        similarity_score(
-            predicted.metadata.prep_time or "",
-            reference.metadata.prep_time or "",
-        )
-        if (predicted.metadata.prep_time or reference.metadata.prep_time)
-        else None
-    )
-    metadata_metrics["cook_time_match"] = (
-        similarity_score(
-            predicted.metadata.cook_time or "",
-            reference.metadata.cook_time or "",
+    # Metadata fields (scored only when at least one side has a value)
+    pred_meta = predicted.metadata
+    ref_meta = reference.metadata
+    metadata_metrics: dict[str, float | bool | None] = {}
+    for field in _METADATA_TEXT_FIELDS:
+        pred_value = getattr(pred_meta, field) or ""
+        ref_value = getattr(ref_meta, field) or ""
+        metadata_metrics[f"{field}_match"] = (
+            similarity_score(pred_value, ref_value) if (pred_value or ref_value) else None
         )
-        if (predicted.metadata.cook_time or reference.metadata.cook_time)
-        else None
-    )
-    metadata_metrics["cuisine_match"] = (
-        similarity_score(
-            predicted.metadata.cuisine or "",
-            reference.metadata.cuisine or "",
-        )
-        if (predicted.metadata.cuisine or reference.metadata.cuisine)
-        else None
-    )
-    metadata_metrics["main_ingredient_match"] = (
-        similarity_score(
-            predicted.metadata.main_ingredient or "",
-            reference.metadata.main_ingredient or "",
-        )
-        if (predicted.metadata.main_ingredient or reference.metadata.main_ingredient)
-        else None
-    )
     metadata_metrics["servings_match"] = (
-        predicted.metadata.servings == reference.metadata.servings
-        if (predicted.metadata.servings and reference.metadata.servings)
+        pred_meta.servings == ref_meta.servings
+        if (pred_meta.servings and ref_meta.servings)
         else None
     )
 
@@ -260,21 +511,9 @@ def evaluate_recipe(predicted: Recipe, reference: Recipe) -> dict[str, Any]:
         "metadata": 0.10,
     }
 
-    # Normalize metadata score
-    metadata_scores = [
-        v for v in metadata_metrics.values() if v is not None and isinstance(v, float | bool)
-    ]
+    # Normalize metadata score (servings_match is a bool; float(True) == 1.0)
+    metadata_scores = [float(v) for v in metadata_metrics.values() if v is not None]
     metadata_score = sum(metadata_scores) / len(metadata_scores) if metadata_scores else 0.0
-    # Convert bool to float
-    if metadata_metrics.get("servings_match") is not None:
-        metadata_scores_bool = [
-            float(v) if isinstance(v, bool) else v
-            for v in metadata_metrics.values()
-            if v is not None
-        ]
-        metadata_score = (
-            sum(metadata_scores_bool) / len(metadata_scores_bool) if metadata_scores_bool else 0.0
-        )
 
     overall_score = (
         weights["title"] * metrics["title_similarity"]
@@ -288,6 +527,38 @@ def evaluate_recipe(predicted: Recipe, reference: Recipe) -> dict[str, Any]:
     return metrics
 
 
+def batch_evaluate(
+    predicted: Sequence[Recipe], references: Sequence[Recipe], workers: int = 1
+) -> list[dict[str, Any]]:
+    """Evaluate predicted recipes against their references pairwise.
+
+    Args:
+        predicted: Predicted recipes from models
+        references: Reference recipe for each prediction (may repeat the same one)
+        workers: Number of worker processes; 1 evaluates in this process. Scoring
+            is pure-Python CPU work that holds the GIL, so threads would not help.
+
+    Returns:
+        Metrics dictionary for each pair, in input order
+
+    Raises:
+        ValueError: If the two sequences differ in length
+    """
+    if len(predicted) != len(references):
+        raise ValueError(f"Got {len(predicted)} predicted recipes but {len(references)} references")
+
+    if workers <= 1 or len(predicted) <= 1:
+        return [evaluate_recipe(pred, ref) for pred, ref in zip(predicted, references, strict=True)]
+
+    # Send contiguous chunks so each worker's caches see repeated references
+    chunksize = max(1, len(predicted) // (workers * 4))
+    # Spawn rather than fork: callers (the benchmarks, pytest-xdist) run threads,
+    # and forking a multi-threaded process can deadlock the child
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        return list(executor.map(evaluate_recipe, predicted, references, chunksize=chunksize))
+
+
 def load_reference_recipe(file_path: Path) -> Recipe:
     """Load reference recipe from JSON file.
 
@@ -304,12 +575,10 @@ def load_reference_recipe(file_path: Path) -> Recipe:
     if not file_path.exists():
         raise FileNotFoundError(f"Reference recipe file not found: {file_path}")
 
-    with open(file_path, encoding="utf-8") as f:
-        data = json.load(f)
-
     try:
-        return Recipe.model_validate(data)
-    except Exception as e:
+        # Parse and validate in one pass in pydantic-core (no intermediate dict)
+        return Recipe.model_validate_json(file_path.read_bytes())
+    except ValidationError as e:
         raise ValueError(f"Invalid reference recipe format: {e}") from e
 
 
@@ -322,7 +591,7 @@ def save_reference_recipe(recipe: Recipe, file_path: Path) -> None:
     """
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(recipe.model_dump(mode="json"), f, indent=2, ensure_ascii=False)
+    # Serialize in pydantic-core directly rather than dumping to a dict first
+    file_path.write_text(recipe.model_dump_json(indent=2), encoding="utf-8")
 
     logger.info(f"Saved reference recipe to {file_path}")
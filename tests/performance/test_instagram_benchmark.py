@@ -6,10 +6,15 @@ These tests are marked as 'slow' and require:
 - Network connectivity
 
 Configuration:
-- OLLAMA_MODELS: Comma-separated list of models to test (required)
+- OLLAMA_MODELS: Comma-separated list of models to test (required; benchmarks skip without it)
 - OLLAMA_MODELS_LIMIT: Limit to first N models for faster testing (optional, default: all)
 - OLLAMA_PRIMARY_MODEL: Test this model first (useful for debugging, optional)
 - OLLAMA_ENDPOINT: Ollama API endpoint (optional, default: http://localhost:11434)
+- OLLAMA_STRUCTURED_OUTPUT: Set to 1 to constrain decoding to the extraction schema
+  (requires Ollama 0.5+, optional)
+- OLLAMA_NUM_PARALLEL: Models to run concurrently in the comparison tests (optional, default: 1).
+  To run every model at once, start the server with OLLAMA_MAX_LOADED_MODELS and
+  OLLAMA_NUM_PARALLEL large enough for all of them to fit in memory together.
 
 Examples:
   # Test all models in OLLAMA_MODELS (only tests models that are available in Ollama)
@@ -18,6 +23,16 @@ Examples:
   # Test only first 2 models (faster iteration)
   OLLAMA_MODELS_LIMIT=2 pytest tests/performance/test_instagram_benchmark.py -m slow -v
 
+  # Sweep several model sets in one run (overrides OLLAMA_MODELS)
+  pytest tests/performance/test_instagram_benchmark.py -m slow --model-set=llama3.1:8b,qwen2.5:7b --model-set=phi3:mini
+
+  # Run the per-model sweep on 4 workers at once. pytest.ini's --dist=loadfile keeps a
+  # module on one worker, so switch to --dist=load; start the server with
+  # OLLAMA_NUM_PARALLEL=4 (or more) so Ollama serves the requests concurrently.
+  # Keep the comparison tests out of it: their recorded timings are only valid in a
+  # serial run (-n 0), without other workers loading the same Ollama server
+  pytest tests/performance/test_instagram_benchmark.py -m slow -n 4 --dist=load -k test_instagram_url_with_model
+
   # Test a specific model first (good for debugging)
   OLLAMA_PRIMARY_MODEL=llama3.1:8b pytest tests/performance/test_instagram_benchmark.py -m slow -v
 
@@ -31,9 +46,12 @@ Examples:
   pytest tests/performance/test_instagram_benchmark.py::TestInstagramBenchmark::test_compare_performance -v -s
 
   # Compare performance AND accuracy (requires reference recipe)
-  # First create reference recipe: python tests/performance/create_reference_recipe.py
+  # First create reference recipe: python -m tests.performance.create_reference_recipe
   pytest tests/performance/test_instagram_benchmark.py::TestInstagramBenchmark::test_compare_all_models -v -s
 
+  # Each comparison run is appended to benchmark_history.jsonl (with the git SHA)
+  jq -c '{sha, test, models: [.results[].model]}' tests/performance/benchmark_history.jsonl
+
   # Check what models are available in Ollama
   ./scripts/check-ollama.sh
 
@@ -43,84 +61,217 @@ Resilience:
 - Better error logging shows what LLM actually returned when extraction fails
 """
 
+import asyncio
+import functools
+import json
 import logging
 import os
+import subprocess
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
 from pathlib import Path
+from typing import Any
 
 import pytest
-from dotenv import load_dotenv
+import requests
 
 from recipe_ingest.core import process_recipe
+from recipe_ingest.llm.client import OllamaClient
+from recipe_ingest.models.recipe import Recipe
+from tests.performance.caption_cache import clear_cached_caption, get_instagram_caption_cached
 from tests.performance.recipe_evaluator import (
-    evaluate_recipe,
     load_reference_recipe,
+    make_evaluator,
 )
 
-# Load environment variables from .env file
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
 # Test Instagram URL - a real recipe post
 TEST_INSTAGRAM_URL = "https://www.instagram.com/reel/DRYdlekE-Yb"
 
+# Keep benchmarked models loaded between tests so later runs don't pay a reload
+BENCHMARK_KEEP_ALIVE = "30m"
+
+# Cap tokens per request; a full recipe is well under this, so it only cuts off runaway
+# decoding that would otherwise dominate extraction_time
+BENCHMARK_NUM_PREDICT = 2048
+
 # Path to reference recipe (gold standard)
 REFERENCE_RECIPE_PATH = Path(__file__).parent / "reference_recipes" / "DRYdlekE-Yb.json"
 
-# Models to benchmark - loaded from .env file
-OLLAMA_MODELS_STR = os.getenv("OLLAMA_MODELS")
-if not OLLAMA_MODELS_STR:
-    raise ValueError(
-        "OLLAMA_MODELS not found in environment. "
-        "Please create a .env file from .env.example and set OLLAMA_MODELS."
-    )
-ALL_MODELS = [model.strip() for model in OLLAMA_MODELS_STR.split(",") if model.strip()]
-
-# Limit models for faster testing (set OLLAMA_MODELS_LIMIT env var to test only first N models)
-# Default: test all models, but can be limited for faster iteration
-MODELS_LIMIT = int(os.getenv("OLLAMA_MODELS_LIMIT", "0"))  # 0 means no limit
-if MODELS_LIMIT > 0:
-    OLLAMA_MODELS = ALL_MODELS[:MODELS_LIMIT]
-    logger.info(f"Limited to first {MODELS_LIMIT} models: {OLLAMA_MODELS}")
-else:
-    OLLAMA_MODELS = ALL_MODELS
-
-# Primary model for testing (set OLLAMA_PRIMARY_MODEL to test a specific model first)
-# Useful for debugging - test a known-good model before testing others
-# If PRIMARY_MODEL is set, it will be used even if not in OLLAMA_MODELS
-PRIMARY_MODEL = os.getenv("OLLAMA_PRIMARY_MODEL")
-if PRIMARY_MODEL:
-    if PRIMARY_MODEL in ALL_MODELS:
-        # Move primary model to front if it exists in the list
-        OLLAMA_MODELS = [PRIMARY_MODEL] + [m for m in OLLAMA_MODELS if m != PRIMARY_MODEL]
-        logger.info(f"Using primary model '{PRIMARY_MODEL}' (found in OLLAMA_MODELS)")
-    else:
-        # Use primary model even if not in OLLAMA_MODELS (for testing specific models)
-        OLLAMA_MODELS = [PRIMARY_MODEL]
-        logger.info(
-            f"Using primary model '{PRIMARY_MODEL}' (not in OLLAMA_MODELS, testing this model only)"
-        )
+# Comparison runs are appended here (one JSON object per line) for cross-run diffs
+HISTORY_PATH = Path(__file__).parent / "benchmark_history.jsonl"
+
+
+def _preload_models(make_client: Callable[[str], OllamaClient], models: Sequence[str]) -> None:
+    """Load every model into Ollama before the timed runs.
+
+    Without this the first request to each model pays the weight-loading cost,
+    so total_time ranks models by load order rather than speed. Models are
+    loaded one at a time to avoid evicting each other on memory-limited hosts;
+    the warmup time is logged and never counted in result.timing.
+
+    Args:
+        make_client: Builds the OllamaClient for a model
+        models: Model names to load
+    """
+    for model in models:
+        start = time.perf_counter()
+        try:
+            make_client(model).preload()
+        except ConnectionError as e:
+            # The timed run will report the failure for this model
+            logger.warning(f"Could not preload {model}: {e}")
+            continue
+        logger.info(f"Preloaded {model} in {time.perf_counter() - start:.2f}s")
+
+
+def _run_models_concurrently(
+    models: Sequence[str], run_one: Callable[[str], dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Run one benchmark per model concurrently on a single event loop.
+
+    process_recipe is synchronous, so each call runs in a worker thread while a
+    semaphore sized by OLLAMA_NUM_PARALLEL bounds how many requests Ollama sees at
+    once. The default of 1 keeps per-model timings free of queueing; raise it to
+    match the server's OLLAMA_NUM_PARALLEL to cut wall-clock time.
+
+    Args:
+        models: Model names to benchmark
+        run_one: Callable that benchmarks one model and returns its result row
+
+    Returns:
+        One result row per model, in input order; failures become {"model", "error"} rows
+    """
+    limit = max(1, int(os.getenv("OLLAMA_NUM_PARALLEL", "1")))
+
+    async def _gather() -> list[Any]:
+        sem = asyncio.Semaphore(limit)
+
+        async def _one(model: str) -> dict[str, Any]:
+            async with sem:
+                return await asyncio.to_thread(run_one, model)
+
+        return await asyncio.gather(*(_one(m) for m in models), return_exceptions=True)
+
+    results: list[dict[str, Any]] = []
+    for model, outcome in zip(models, asyncio.run(_gather()), strict=True):
+        if isinstance(outcome, BaseException):
+            logger.warning(f"✗ {model}: Failed - {outcome}")
+            results.append({"model": model, "error": str(outcome)})
+        else:
+            results.append(outcome)
+    return results
+
+
+def _partition_results(
+    results: Sequence[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Split result rows into (successful, failed) in a single pass."""
+    successful: list[dict[str, Any]] = []
+    failed: list[dict[str, Any]] = []
+    for r in results:
+        (failed if "error" in r else successful).append(r)
+    return successful, failed
+
+
+def _git_sha() -> str | None:
+    """Get the current commit SHA, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
 
 
-@pytest.fixture
-def temp_vault(tmp_path: Path) -> Path:
-    """Create a temporary vault directory for testing."""
-    vault = tmp_path / "test_vault"
-    vault.mkdir()
-    return vault
+def _record_history(test_name: str, results: Sequence[dict[str, Any]]) -> list[str]:
+    """Append a comparison run to HISTORY_PATH and diff it against the previous run.
 
+    Args:
+        test_name: Comparison test that produced the results
+        results: Result rows for this run
 
-@pytest.fixture
+    Returns:
+        Report lines with each model's total_time change since the previous run
+        of the same test (empty if there is no previous run)
+    """
+    previous: dict[str, Any] | None = None
+    if HISTORY_PATH.exists():
+        with HISTORY_PATH.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry.get("test") == test_name:
+                    previous = entry
+
+    entry = {"test": test_name, "sha": _git_sha(), "ts": time.time(), "results": list(results)}
+    with HISTORY_PATH.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, default=str) + "\n")
+
+    if previous is None:
+        return []
+
+    previous_times = {r["model"]: r["total_time"] for r in previous["results"] if "total_time" in r}
+    lines = [f"\nChange since previous run ({previous.get('sha') or 'unknown'}):"]
+    for r in results:
+        before = previous_times.get(r["model"])
+        if before and "total_time" in r:
+            change = r["total_time"] / before - 1
+            lines.append(
+                f"{r['model']:<20} {before:.2f}s -> {r['total_time']:.2f}s ({change:+.1%})"
+            )
+    return lines
+
+
+@functools.lru_cache(maxsize=4)
+def _list_models(ollama_endpoint: str) -> tuple[str, ...]:
+    """List the models installed in Ollama, once per endpoint per process."""
+    with OllamaClient(base_url=ollama_endpoint) as client:
+        return tuple(client.list_models())
+
+
+@pytest.fixture(scope="session")
 def ollama_endpoint() -> str:
     """Get Ollama endpoint from environment or use default."""
-    import os
-
     return os.getenv("OLLAMA_ENDPOINT", "http://localhost:11434")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def ollama_client_factory(ollama_endpoint: str) -> Iterator[Callable[[str], OllamaClient]]:
+    """Build per-model OllamaClients that share one keep-alive HTTP session.
+
+    Every request after the first reuses the pooled connection instead of
+    opening a new one per test.
+
+    Yields:
+        Callable that returns an OllamaClient for a model name
+    """
+    with requests.Session() as session:
+
+        def make_client(model: str) -> OllamaClient:
+            return OllamaClient(
+                base_url=ollama_endpoint,
+                model=model,
+                keep_alive=BENCHMARK_KEEP_ALIVE,
+                session=session,
+                num_predict=BENCHMARK_NUM_PREDICT,
+                structured_output=os.getenv("OLLAMA_STRUCTURED_OUTPUT") == "1",
+            )
+
+        yield make_client
+
+
+@pytest.fixture(scope="session")
 def available_ollama_models(ollama_endpoint: str) -> list[str]:
-    """Get list of available models from Ollama.
+    """Get list of available models from Ollama, probed once per session.
 
     Returns:
         List of available model names
@@ -128,11 +279,8 @@ def available_ollama_models(ollama_endpoint: str) -> list[str]:
     Raises:
         pytest.Skip: If Ollama is not accessible
     """
-    from recipe_ingest.llm.client import OllamaClient
-
     try:
-        client = OllamaClient(base_url=ollama_endpoint)
-        models = client.list_models()
+        models = list(_list_models(ollama_endpoint))
         logger.info(f"Found {len(models)} available models in Ollama: {models}")
         return models
     except Exception as e:
@@ -140,9 +288,12 @@ def available_ollama_models(ollama_endpoint: str) -> list[str]:
         pytest.skip(f"Cannot access Ollama to list models: {e}")
 
 
-@pytest.fixture
-def instagram_caption() -> str:
-    """Extract Instagram caption once for all tests.
+@pytest.fixture(scope="session")
+def instagram_caption(request: pytest.FixtureRequest) -> str:
+    """Extract Instagram caption once for the whole session.
+
+    The caption is also cached on disk (see caption_cache), so repeat runs skip
+    the Instagram fetch entirely; pass --cache-clear to force a refetch.
 
     Returns:
         Extracted caption text
@@ -150,20 +301,20 @@ def instagram_caption() -> str:
     Raises:
         pytest.Skip: If Instagram extraction fails
     """
-    from recipe_ingest.parsers.instagram import InstagramParser
+    if request.config.getoption("cacheclear", default=False):
+        clear_cached_caption(TEST_INSTAGRAM_URL)
 
-    instagram_parser = InstagramParser()
     try:
-        caption = instagram_parser.parse(TEST_INSTAGRAM_URL)
+        caption = get_instagram_caption_cached(TEST_INSTAGRAM_URL)
         logger.info(f"Extracted Instagram caption ({len(caption)} characters)")
         return caption
     except Exception as e:
         pytest.skip(f"Failed to extract Instagram caption: {e}")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def reference_recipe():
-    """Load reference recipe (gold standard) for accuracy evaluation.
+    """Load reference recipe (gold standard) once for the whole session.
 
     Returns:
         Reference Recipe object
@@ -184,6 +335,16 @@ def reference_recipe():
         pytest.skip(f"Failed to load reference recipe: {e}")
 
 
+@pytest.fixture(scope="session")
+def reference_evaluator(reference_recipe) -> Callable[[Recipe], dict[str, Any]]:
+    """Evaluate predictions against the reference, with its indexes built once.
+
+    Returns:
+        Function taking a predicted recipe and returning evaluate_recipe's metrics
+    """
+    return make_evaluator(reference_recipe)
+
+
 @pytest.mark.slow
 @pytest.mark.performance
 @pytest.mark.integration
@@ -192,8 +353,10 @@ class TestInstagramBenchmark:
 
     def test_setup_smoke_test(
         self,
-        temp_vault: Path,
+        ollama_models: list[str],
+        available_ollama_models: list[str],
         ollama_endpoint: str,
+        ollama_client_factory: Callable[[str], OllamaClient],
         instagram_caption: str,
     ) -> None:
         """Simple smoke test to verify test setup is working.
@@ -207,51 +370,45 @@ class TestInstagramBenchmark:
         The model will be used even if it's not in your OLLAMA_MODELS list.
 
         Args:
-            temp_vault: Temporary vault directory
+            ollama_models: Models configured for benchmarking
+            available_ollama_models: List of models available in Ollama
             ollama_endpoint: Ollama API endpoint
+            ollama_client_factory: Builds OllamaClients sharing one HTTP session
             instagram_caption: Pre-extracted Instagram caption
         """
-        if not OLLAMA_MODELS:
-            pytest.skip("No models configured for testing")
-
         # Use first model for smoke test (which will be PRIMARY_MODEL if set)
-        model = OLLAMA_MODELS[0]
+        model = ollama_models[0]
+        primary_model = os.getenv("OLLAMA_PRIMARY_MODEL")
         logger.info(f"Smoke test with model: {model}")
-        logger.info(f"Available models in test: {OLLAMA_MODELS}")
-        if PRIMARY_MODEL:
-            logger.info(f"PRIMARY_MODEL was set to: {PRIMARY_MODEL}")
+        logger.info(f"Available models in test: {ollama_models}")
+        if primary_model:
+            logger.info(f"PRIMARY_MODEL was set to: {primary_model}")
         logger.info(f"Input caption length: {len(instagram_caption)} chars")
 
         # Verify the model matches what was requested
-        if PRIMARY_MODEL and model != PRIMARY_MODEL:
+        if primary_model and model != primary_model:
             logger.warning(
-                f"Requested PRIMARY_MODEL '{PRIMARY_MODEL}' but using '{model}'. "
+                f"Requested PRIMARY_MODEL '{primary_model}' but using '{model}'. "
                 f"Check that the model name matches exactly."
             )
 
-        # Optionally check if model is available in Ollama
-        try:
-            from recipe_ingest.llm.client import OllamaClient
-
-            client = OllamaClient(base_url=ollama_endpoint, model=model)
-            available_models = client.list_models()
-            if model not in available_models:
-                logger.warning(
-                    f"Model '{model}' not found in Ollama. Available models: {available_models}"
-                )
-        except Exception as e:
-            logger.debug(f"Could not check available models: {e}")
+        # Warn (but still try) if the model is not installed in Ollama
+        if model not in available_ollama_models:
+            logger.warning(
+                f"Model '{model}' not found in Ollama. Available models: {available_ollama_models}"
+            )
 
         try:
             result = process_recipe(
                 input_text=instagram_caption,
-                vault_path=temp_vault,
+                vault_path=None,
                 llm_endpoint=ollama_endpoint,
                 llm_model=model,
                 recipes_dir="personal/recipes",
                 overwrite=False,
                 preview_only=True,
                 source_url=TEST_INSTAGRAM_URL,
+                llm_client=ollama_client_factory(model),
             )
 
             # Basic verification
@@ -269,14 +426,14 @@ class TestInstagramBenchmark:
             logger.error(f"Setup test failed with {model}: {e}")
             pytest.skip(f"Model '{model}' failed extraction (may be too small/weak): {e}")
 
-    @pytest.mark.parametrize("model", OLLAMA_MODELS)
+    # Parametrized over the configured models by pytest_generate_tests in conftest.py
     def test_instagram_url_with_model(
         self,
         model: str,
-        temp_vault: Path,
+        available_ollama_models: list[str],
         ollama_endpoint: str,
+        ollama_client_factory: Callable[[str], OllamaClient],
         instagram_caption: str,
-        available_ollama_models: list[str],
     ) -> None:
         """Test processing Instagram URL with a specific Ollama model.
 
@@ -287,10 +444,10 @@ class TestInstagramBenchmark:
 
         Args:
             model: Ollama model name to test
-            temp_vault: Temporary vault directory
+            available_ollama_models: List of models available in Ollama
             ollama_endpoint: Ollama API endpoint
+            ollama_client_factory: Builds OllamaClients sharing one HTTP session
             instagram_caption: Pre-extracted Instagram caption
-            available_ollama_models: List of models available in Ollama
         """
         logger.info(f"Testing Instagram URL with model: {model}")
 
@@ -306,13 +463,14 @@ class TestInstagramBenchmark:
         try:
             result = process_recipe(
                 input_text=instagram_caption,
-                vault_path=temp_vault,
+                vault_path=None,
                 llm_endpoint=ollama_endpoint,
                 llm_model=model,
                 recipes_dir="personal/recipes",
                 overwrite=False,
                 preview_only=True,  # Don't write files, just measure performance
                 source_url=TEST_INSTAGRAM_URL,
+                llm_client=ollama_client_factory(model),
             )
 
             # Verify results
@@ -355,10 +513,11 @@ class TestInstagramBenchmark:
 
     def test_compare_performance(
         self,
-        temp_vault: Path,
+        ollama_models: list[str],
+        available_ollama_models: list[str],
         ollama_endpoint: str,
+        ollama_client_factory: Callable[[str], OllamaClient],
         instagram_caption: str,
-        available_ollama_models: list[str],
     ) -> None:
         """Compare performance (timing) across all available models.
 
@@ -366,15 +525,16 @@ class TestInstagramBenchmark:
         Does not require a reference recipe - just shows speed differences.
 
         Args:
-            temp_vault: Temporary vault directory
+            ollama_models: Models configured for benchmarking
+            available_ollama_models: List of models available in Ollama
             ollama_endpoint: Ollama API endpoint
+            ollama_client_factory: Builds OllamaClients sharing one HTTP session
             instagram_caption: Pre-extracted Instagram caption
-            available_ollama_models: List of models available in Ollama
         """
 
         # Filter to only models that are available
-        models_to_test = [m for m in OLLAMA_MODELS if m in available_ollama_models]
-        missing_models = [m for m in OLLAMA_MODELS if m not in available_ollama_models]
+        models_to_test = [m for m in ollama_models if m in available_ollama_models]
+        missing_models = [m for m in ollama_models if m not in available_ollama_models]
 
         if missing_models:
             logger.warning(
@@ -385,122 +545,116 @@ class TestInstagramBenchmark:
         if not models_to_test:
             pytest.skip(
                 f"None of the configured models are available in Ollama. "
-                f"Configured: {OLLAMA_MODELS}, Available: {available_ollama_models}"
+                f"Configured: {ollama_models}, Available: {available_ollama_models}"
             )
 
         logger.info(f"Testing {len(models_to_test)} available models: {models_to_test}")
 
-        results = []
-
-        for model in models_to_test:
-            try:
-                result = process_recipe(
-                    input_text=instagram_caption,
-                    vault_path=temp_vault,
-                    llm_endpoint=ollama_endpoint,
-                    llm_model=model,
-                    recipes_dir="personal/recipes",
-                    overwrite=False,
-                    preview_only=True,
-                    source_url=TEST_INSTAGRAM_URL,
-                )
-
-                results.append(
-                    {
-                        "model": model,
-                        "total_time": result.timing["total_time"],
-                        "extraction_time": result.timing["extraction_time"],
-                        "formatting_time": result.timing["formatting_time"],
-                        "title": result.recipe.metadata.title,
-                        "ingredients_count": len(result.recipe.ingredients),
-                        "instructions_count": len(result.recipe.instructions),
-                        "has_nutrition": result.recipe.metadata.calories_per_serving is not None,
-                    }
-                )
-
-                logger.info(
-                    f"✓ {model}: {result.timing['total_time']:.2f}s total "
-                    f"({result.timing['extraction_time']:.2f}s extraction) - "
-                    f"{result.recipe.metadata.title}"
-                )
-
-            except (ConnectionError, Exception) as e:
-                logger.warning(f"✗ {model}: Failed - {e}")
-                results.append(
-                    {
-                        "model": model,
-                        "error": str(e),
-                    }
-                )
+        def run_one(model: str) -> dict[str, Any]:
+            result = process_recipe(
+                input_text=instagram_caption,
+                vault_path=None,
+                llm_endpoint=ollama_endpoint,
+                llm_model=model,
+                recipes_dir="personal/recipes",
+                overwrite=False,
+                preview_only=True,
+                source_url=TEST_INSTAGRAM_URL,
+                llm_client=ollama_client_factory(model),
+            )
 
-        # Print comparison table
-        print("\n" + "=" * 100)
-        print("PERFORMANCE COMPARISON")
-        print("=" * 100)
-        print(
+            logger.info(
+                f"✓ {model}: {result.timing['total_time']:.2f}s total "
+                f"({result.timing['extraction_time']:.2f}s extraction) - "
+                f"{result.recipe.metadata.title}"
+            )
+            return {
+                "model": model,
+                "total_time": result.timing["total_time"],
+                "extraction_time": result.timing["extraction_time"],
+                "formatting_time": result.timing["formatting_time"],
+                "title": result.recipe.metadata.title,
+                "ingredients_count": len(result.recipe.ingredients),
+                "instructions_count": len(result.recipe.instructions),
+                "has_nutrition": result.recipe.metadata.calories_per_serving is not None,
+            }
+
+        _preload_models(ollama_client_factory, models_to_test)
+        results = _run_models_concurrently(models_to_test, run_one)
+
+        # Build the comparison table and print it in one write
+        lines = [
+            "",
+            "=" * 100,
+            "PERFORMANCE COMPARISON",
+            "=" * 100,
             f"{'Model':<20} {'Total (s)':<12} {'Extraction (s)':<15} {'Formatting (s)':<15} "
-            f"{'Ingredients':<12} {'Instructions':<12} {'Status':<15}"
-        )
-        print("-" * 100)
+            f"{'Ingredients':<12} {'Instructions':<12} {'Status':<15}",
+            "-" * 100,
+        ]
 
-        successful_results = [r for r in results if "error" not in r]
+        successful_results, failed_results = _partition_results(results)
         if successful_results:
             # Sort by total time (ascending) - fastest first
             successful_results.sort(key=lambda x: x["total_time"])
 
-            for r in successful_results:
-                print(
-                    f"{r['model']:<20} {r['total_time']:<12.2f} {r['extraction_time']:<15.2f} "
-                    f"{r['formatting_time']:<15.2f} {r['ingredients_count']:<12} "
-                    f"{r['instructions_count']:<12} Success"
-                )
+            lines.extend(
+                f"{r['model']:<20} {r['total_time']:<12.2f} {r['extraction_time']:<15.2f} "
+                f"{r['formatting_time']:<15.2f} {r['ingredients_count']:<12} "
+                f"{r['instructions_count']:<12} Success"
+                for r in successful_results
+            )
 
             # Show failed models
-            failed_results = [r for r in results if "error" in r]
-            for r in failed_results:
-                print(
-                    f"{r['model']:<20} {'N/A':<12} {'N/A':<15} {'N/A':<15} "
-                    f"{'N/A':<12} {'N/A':<12} Failed: {r['error'][:50]}"
-                )
+            lines.extend(
+                f"{r['model']:<20} {'N/A':<12} {'N/A':<15} {'N/A':<15} "
+                f"{'N/A':<12} {'N/A':<12} Failed: {r['error'][:50]}"
+                for r in failed_results
+            )
 
-            print("=" * 100)
+            lines.append("=" * 100)
             fastest = successful_results[0]
             slowest = successful_results[-1]
-            print(f"\nFastest: {fastest['model']} ({fastest['total_time']:.2f}s)")
-            print(f"Slowest: {slowest['model']} ({slowest['total_time']:.2f}s)")
+            lines.append(f"\nFastest: {fastest['model']} ({fastest['total_time']:.2f}s)")
+            lines.append(f"Slowest: {slowest['model']} ({slowest['total_time']:.2f}s)")
             if len(successful_results) > 1:
                 speedup = slowest["total_time"] / fastest["total_time"]
-                print(f"Speed difference: {speedup:.2f}x faster")
+                lines.append(f"Speed difference: {speedup:.2f}x faster")
 
         else:
-            print("No models succeeded. Check Ollama availability and model names.")
+            lines.append("No models succeeded. Check Ollama availability and model names.")
+
+        lines.extend(_record_history("test_compare_performance", results))
+        print("\n".join(lines))
 
         # At least one model should succeed
         assert len(successful_results) > 0, "At least one model should succeed"
 
     def test_compare_all_models(
         self,
-        temp_vault: Path,
+        ollama_models: list[str],
+        available_ollama_models: list[str],
         ollama_endpoint: str,
+        ollama_client_factory: Callable[[str], OllamaClient],
         instagram_caption: str,
-        reference_recipe,
-        available_ollama_models: list[str],
+        reference_evaluator: Callable[[Recipe], dict[str, Any]],
     ) -> None:
         """Compare all available models and report performance and accuracy.
 
         This test runs all models and collects timing and accuracy data for comparison.
 
         Args:
-            temp_vault: Temporary vault directory
+            ollama_models: Models configured for benchmarking
+            available_ollama_models: List of models available in Ollama
             ollama_endpoint: Ollama API endpoint
+            ollama_client_factory: Builds OllamaClients sharing one HTTP session
             instagram_caption: Pre-extracted Instagram caption
-            reference_recipe: Reference (gold standard) recipe for comparison
-            available_ollama_models: List of models available in Ollama
+            reference_evaluator: Scores a recipe against the reference (gold standard)
         """
 
         # Filter to only models that are available
-        models_to_test = [m for m in OLLAMA_MODELS if m in available_ollama_models]
-        missing_models = [m for m in OLLAMA_MODELS if m not in available_ollama_models]
+        models_to_test = [m for m in ollama_models if m in available_ollama_models]
+        missing_models = [m for m in ollama_models if m not in available_ollama_models]
 
         if missing_models:
             logger.warning(
@@ -511,106 +665,105 @@ class TestInstagramBenchmark:
         if not models_to_test:
             pytest.skip(
                 f"None of the configured models are available in Ollama. "
-                f"Configured: {OLLAMA_MODELS}, Available: {available_ollama_models}"
+                f"Configured: {ollama_models}, Available: {available_ollama_models}"
             )
 
         logger.info(f"Testing {len(models_to_test)} available models: {models_to_test}")
 
-        results = []
-
-        for model in models_to_test:
-            try:
-                result = process_recipe(
-                    input_text=instagram_caption,
-                    vault_path=temp_vault,
-                    llm_endpoint=ollama_endpoint,
-                    llm_model=model,
-                    recipes_dir="personal/recipes",
-                    overwrite=False,
-                    preview_only=True,
-                    source_url=TEST_INSTAGRAM_URL,
-                )
-
-                # Evaluate accuracy
-                accuracy_metrics = evaluate_recipe(result.recipe, reference_recipe)
-
-                results.append(
-                    {
-                        "model": model,
-                        "total_time": result.timing["total_time"],
-                        "extraction_time": result.timing["extraction_time"],
-                        "formatting_time": result.timing["formatting_time"],
-                        "title": result.recipe.metadata.title,
-                        "ingredients_count": len(result.recipe.ingredients),
-                        "instructions_count": len(result.recipe.instructions),
-                        "has_nutrition": result.recipe.metadata.calories_per_serving is not None,
-                        "overall_accuracy": accuracy_metrics["overall_score"],
-                        "title_similarity": accuracy_metrics["title_similarity"],
-                        "ingredients_f1": accuracy_metrics["ingredients"]["f1"],
-                        "instructions_f1": accuracy_metrics["instructions"]["f1"],
-                    }
-                )
+        evaluate_lock = threading.Lock()
 
-                logger.info(
-                    f"✓ {model}: {result.timing['total_time']:.2f}s | "
-                    f"Accuracy: {accuracy_metrics['overall_score']:.2%} "
-                    f"({result.recipe.metadata.title})"
-                )
+        def run_one(model: str) -> dict[str, Any]:
+            result = process_recipe(
+                input_text=instagram_caption,
+                vault_path=None,
+                llm_endpoint=ollama_endpoint,
+                llm_model=model,
+                recipes_dir="personal/recipes",
+                overwrite=False,
+                preview_only=True,
+                source_url=TEST_INSTAGRAM_URL,
+                llm_client=ollama_client_factory(model),
+            )
 
-            except (ConnectionError, Exception) as e:
-                logger.warning(f"✗ {model}: Failed - {e}")
-                results.append(
-                    {
-                        "model": model,
-                        "error": str(e),
-                    }
-                )
+            # Evaluate accuracy
+            # The evaluator's prebuilt matchers are not thread-safe
+            with evaluate_lock:
+                accuracy_metrics = reference_evaluator(result.recipe)
 
-        # Print comparison table
-        print("\n" + "=" * 100)
-        print("PERFORMANCE & ACCURACY COMPARISON")
-        print("=" * 100)
-        print(
+            logger.info(
+                f"✓ {model}: {result.timing['total_time']:.2f}s | "
+                f"Accuracy: {accuracy_metrics['overall_score']:.2%} "
+                f"({result.recipe.metadata.title})"
+            )
+            return {
+                "model": model,
+                "total_time": result.timing["total_time"],
+                "extraction_time": result.timing["extraction_time"],
+                "formatting_time": result.timing["formatting_time"],
+                "title": result.recipe.metadata.title,
+                "ingredients_count": len(result.recipe.ingredients),
+                "instructions_count": len(result.recipe.instructions),
+                "has_nutrition": result.recipe.metadata.calories_per_serving is not None,
+                "overall_accuracy": accuracy_metrics["overall_score"],
+                "title_similarity": accuracy_metrics["title_similarity"],
+                "ingredients_f1": accuracy_metrics["ingredients"]["f1"],
+                "instructions_f1": accuracy_metrics["instructions"]["f1"],
+            }
+
+        _preload_models(ollama_client_factory, models_to_test)
+        results = _run_models_concurrently(models_to_test, run_one)
+
+        # Build the comparison table and print it in one write
+        lines = [
+            "",
+            "=" * 100,
+            "PERFORMANCE & ACCURACY COMPARISON",
+            "=" * 100,
             f"{'Model':<15} {'Total (s)':<12} {'Accuracy':<12} {'Title':<12} "
-            f"{'Ing F1':<10} {'Inst F1':<10} {'Status':<15}"
-        )
-        print("-" * 100)
+            f"{'Ing F1':<10} {'Inst F1':<10} {'Status':<15}",
+            "-" * 100,
+        ]
 
-        successful_results = [r for r in results if "error" not in r]
+        successful_results, failed_results = _partition_results(results)
         if successful_results:
             # Sort by overall accuracy (descending), then by total time (ascending)
             successful_results.sort(key=lambda x: (-x["overall_accuracy"], x["total_time"]))
 
+            # Track fastest and best accuracy/time balance while building rows
+            fastest = best_balance = successful_results[0]
+            best_ratio = best_balance["overall_accuracy"] / best_balance["total_time"]
             for r in successful_results:
-                print(
+                if r["total_time"] < fastest["total_time"]:
+                    fastest = r
+                ratio = r["overall_accuracy"] / r["total_time"]
+                if ratio > best_ratio:
+                    best_balance, best_ratio = r, ratio
+                lines.append(
                     f"{r['model']:<15} {r['total_time']:<12.2f} "
                     f"{r['overall_accuracy']:<12.2%} {r['title_similarity']:<12.2%} "
                     f"{r['ingredients_f1']:<10.2%} {r['instructions_f1']:<10.2%} Success"
                 )
 
             # Show failed models
-            failed_results = [r for r in results if "error" in r]
-            for r in failed_results:
-                print(
-                    f"{r['model']:<15} {'N/A':<12} {'N/A':<12} {'N/A':<12} {'N/A':<10} {'N/A':<10} Failed: {r['error']}"
-                )
+            lines.extend(
+                f"{r['model']:<15} {'N/A':<12} {'N/A':<12} {'N/A':<12} {'N/A':<10} "
+                f"{'N/A':<10} Failed: {r['error']}"
+                for r in failed_results
+            )
 
-            print("=" * 100)
-            print(
+            lines.append("=" * 100)
+            lines.append(
                 f"\nMost Accurate: {successful_results[0]['model']} "
                 f"({successful_results[0]['overall_accuracy']:.2%})"
             )
-            print(
-                f"Fastest: {min(successful_results, key=lambda x: x['total_time'])['model']} "
-                f"({min(successful_results, key=lambda x: x['total_time'])['total_time']:.2f}s)"
-            )
-            print(
-                f"Best Balance: {max(successful_results, key=lambda x: x['overall_accuracy'] / x['total_time'])['model']} "
-                f"(Accuracy/Time ratio)"
-            )
+            lines.append(f"Fastest: {fastest['model']} ({fastest['total_time']:.2f}s)")
+            lines.append(f"Best Balance: {best_balance['model']} (Accuracy/Time ratio)")
 
         else:
-            print("No models succeeded. Check Ollama availability and model names.")
+            lines.append("No models succeeded. Check Ollama availability and model names.")
+
+        lines.extend(_record_history("test_compare_all_models", results))
+        print("\n".join(lines))
 
         # At least one model should succeed
         assert len(successful_results) > 0, "At least one model should succeed"
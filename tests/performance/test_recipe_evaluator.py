@@ -0,0 +1,152 @@
+"""Unit tests for the benchmark recipe evaluator."""
+
+import random
+from itertools import permutations
+
+import pytest
+
+from recipe_ingest.models.recipe import Recipe, RecipeMetadata
+from tests.performance.recipe_evaluator import (
+    _optimal_assign,
+    batch_evaluate,
+    compare_ingredients,
+    token_jaccard,
+)
+
+
+class TestTokenJaccard:
+    """Tests for the token-set Jaccard scorer."""
+
+    @pytest.mark.parametrize(
+        ("str1", "str2", "expected"),
+        [
+            pytest.param("2 cups flour sifted", "sifted flour 2 cups", 1.0, id="reordered"),
+            pytest.param("2 Cups Flour", "2 cups flour", 1.0, id="case-insensitive"),
+            pytest.param("1 cup sugar", "1 cup flour", 0.5, id="partial-overlap"),
+            pytest.param("salt", "pepper", 0.0, id="disjoint"),
+            pytest.param("", "", 1.0, id="both-empty"),
+            pytest.param("salt", "", 0.0, id="one-empty"),
+        ],
+    )
+    def test_scores(self, str1: str, str2: str, expected: float) -> None:
+        """Test word order and case are ignored and overlap is scored by set size."""
+        assert token_jaccard(str1, str2) == pytest.approx(expected)
+
+    def test_drives_ingredient_matching(self) -> None:
+        """Test scorer=token_jaccard matches reordered ingredients the default scorer misses."""
+        predicted = ["flour sifted 2 cups", "eggs 3 large"]
+        reference = ["2 cups flour sifted", "3 large eggs"]
+
+        default = compare_ingredients(predicted, reference)
+        jaccard = compare_ingredients(predicted, reference, scorer=token_jaccard)
+
+        assert default["matched_count"] < 2
+        assert jaccard["matched_count"] == 2
+        assert [(i, j) for i, j, _ in jaccard["matches"]] == [(0, 0), (1, 1)]
+
+
+def _brute_force_best(weights: list[list[float]], threshold: float) -> float:
+    """Best total above-threshold score over every one-to-one row/column assignment."""
+    n_rows, n_cols = len(weights), len(weights[0])
+
+    def kept(w: float) -> float:
+        return w if w >= threshold else 0.0
+
+    if n_rows <= n_cols:
+        return max(
+            sum(kept(weights[i][j]) for i, j in enumerate(cols))
+            for cols in permutations(range(n_cols), n_rows)
+        )
+    return max(
+        sum(kept(weights[i][j]) for j, i in enumerate(rows))
+        for rows in permutations(range(n_rows), n_cols)
+    )
+
+
+class TestOptimalAssign:
+    """Tests for the Hungarian matching behind compare_ingredients(optimal=True)."""
+
+    @pytest.mark.parametrize("seed", range(50))
+    def test_matches_brute_force(self, seed: int) -> None:
+        """Test the assignment total equals the best over all permutations."""
+        rng = random.Random(seed)
+        n_rows, n_cols = rng.randint(1, 5), rng.randint(1, 5)
+        weights = [[round(rng.random(), 2) for _ in range(n_cols)] for _ in range(n_rows)]
+        threshold = 0.5
+
+        matches = _optimal_assign(n_rows, n_cols, lambda i, j: weights[i][j], threshold)
+
+        assert len({i for i, _, _ in matches}) == len(matches)
+        assert len({j for _, j, _ in matches}) == len(matches)
+        assert all(score == weights[i][j] >= threshold for i, j, score in matches)
+        assert sum(score for _, _, score in matches) == pytest.approx(
+            _brute_force_best(weights, threshold)
+        )
+
+    def test_optimal_beats_greedy(self) -> None:
+        """Test optimal=True finds a matching that greedy list-order matching misses."""
+        # "a" is slightly closer to "x", but only "y" is left for it if "b" takes "x"
+        table = {("a", "x"): 0.9, ("a", "y"): 0.85, ("b", "x"): 0.85}
+
+        def scorer(pred: str, ref: str) -> float:
+            return table.get((pred, ref), 0.0)
+
+        greedy = compare_ingredients(["a", "b"], ["x", "y"], scorer=scorer)
+        optimal = compare_ingredients(["a", "b"], ["x", "y"], scorer=scorer, optimal=True)
+
+        assert greedy["matched_count"] == 1
+        assert optimal["matched_count"] == 2
+        assert [(i, j) for i, j, _ in optimal["matches"]] == [(0, 1), (1, 0)]
+
+
+def _recipe(title: str, ingredients: list[str], instructions: list[str]) -> Recipe:
+    """Build a recipe with only the fields the evaluator scores."""
+    return Recipe(
+        metadata=RecipeMetadata(title=title, servings=4),
+        ingredients=ingredients,
+        instructions=instructions,
+    )
+
+
+@pytest.fixture(scope="module")
+def pairs() -> tuple[list[Recipe], list[Recipe]]:
+    """Predictions of varying quality, each paired with one of two references."""
+    pasta = _recipe(
+        "Tomato Pasta",
+        ["200g pasta", "1 cup tomato sauce", "1 tsp salt"],
+        ["Boil water", "Cook pasta", "Add sauce"],
+    )
+    cookies = _recipe(
+        "Chocolate Chip Cookies",
+        ["2 cups flour", "1 cup butter", "1 cup chocolate chips"],
+        ["Cream butter", "Mix in flour", "Fold in chips", "Bake"],
+    )
+    predicted = [
+        pasta,
+        _recipe("Pasta", ["200 g pasta", "tomato sauce"], ["Boil water", "Cook pasta"]),
+        _recipe("Soup", ["water"], ["Heat"]),
+        cookies,
+        _recipe("Cookies", ["2 cups flour", "1 cup chocolate chips"], ["Mix", "Bake"]),
+        _recipe("Cake", ["3 eggs"], ["Whisk eggs"]),
+    ]
+    references = [pasta, pasta, pasta, cookies, cookies, cookies]
+    return predicted, references
+
+
+class TestBatchEvaluate:
+    """Tests for batch_evaluate."""
+
+    def test_workers_match_serial(self, pairs: tuple[list[Recipe], list[Recipe]]) -> None:
+        """Test evaluating in worker processes gives the serial results, in order."""
+        predicted, references = pairs
+
+        assert batch_evaluate(predicted, references, workers=2) == batch_evaluate(
+            predicted, references
+        )
+
+    def test_length_mismatch_raises_error(self, pairs: tuple[list[Recipe], list[Recipe]]) -> None:
+        """Test predictions and references of different lengths raise ValueError."""
+        predicted, references = pairs
+
+        with pytest.raises(ValueError, match="6 predicted recipes but 5 references"):
+            batch_evaluate(predicted, references[:-1])
@@ -1,9 +1,53 @@
 """Unit tests for configuration management."""
 
+from operator import attrgetter
+from pathlib import Path
+from typing import Any
+
 import pytest
 
 from recipe_ingest.config import Settings, load_settings
 
+# Environment variables to set -> expected settings, keyed by dotted attribute path
+ENV_CASES = [
+    pytest.param(
+        {
+            "RECIPE_INGEST_LLM_ENDPOINT": "http://test:11434",
+            "RECIPE_INGEST_LLM_MODEL": "test-model",
+            "RECIPE_INGEST_LLM_TIMEOUT": "90",
+            "RECIPE_INGEST_VAULT_PATH": "/test/vault",
+            "RECIPE_INGEST_VAULT_RECIPES_DIR": "recipes",
+            "RECIPE_INGEST_LOG_LEVEL": "DEBUG",
+        },
+        {
+            "llm.endpoint": "http://test:11434",
+            "llm.model": "test-model",
+            "llm.timeout": 90,
+            "vault.path": Path("/test/vault"),
+            "vault.recipes_dir": "recipes",
+            "log_level": "DEBUG",
+        },
+        id="all-env-vars",
+    ),
+    # LLM_BASE_URL is a simpler alternative to RECIPE_INGEST_LLM_ENDPOINT
+    pytest.param(
+        {"LLM_BASE_URL": "http://ollama:11434", "RECIPE_INGEST_LLM_MODEL": "test-model"},
+        {"llm.endpoint": "http://ollama:11434", "llm.model": "test-model"},
+        id="llm-base-url",
+    ),
+    # Model from env, endpoint from default
+    pytest.param(
+        {"RECIPE_INGEST_LLM_MODEL": "custom-model"},
+        {"llm.model": "custom-model", "llm.endpoint": "http://localhost:11434", "vault": None},
+        id="partial-env-vars",
+    ),
+    pytest.param(
+        {"RECIPE_INGEST_LLM_ENDPOINT": "http://custom:11434", "RECIPE_INGEST_LLM_TIMEOUT": "60"},
+        {"llm.endpoint": "http://custom:11434", "llm.timeout": 60, "llm.model": "llama3.1:8b"},
+        id="env-overrides-defaults",
+    ),
+]
+
 
 class TestSettings:
     """Tests for Settings class."""
@@ -30,64 +74,26 @@ class TestSettings:
 class TestLoadSettings:
     """Tests for load_settings function."""
 
-    def test_load_settings_with_defaults(self) -> None:
-        """Test loading settings with all defaults."""
-        settings = load_settings()
-        assert settings.llm.model == "llama3.1:8b"  # Default
-        assert settings.llm.endpoint == "http://localhost:11434"
-        assert settings.llm.timeout == 120
-        assert settings.vault is None
-        assert settings.log_level == "INFO"
-
-    def test_load_settings_from_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Test loading settings from environment variables."""
-        monkeypatch.setenv("RECIPE_INGEST_LLM_ENDPOINT", "http://test:11434")
-        monkeypatch.setenv("RECIPE_INGEST_LLM_MODEL", "test-model")
-        monkeypatch.setenv("RECIPE_INGEST_LLM_TIMEOUT", "90")
-        monkeypatch.setenv("RECIPE_INGEST_VAULT_PATH", "/test/vault")
-        monkeypatch.setenv("RECIPE_INGEST_VAULT_RECIPES_DIR", "recipes")
-        monkeypatch.setenv("RECIPE_INGEST_LOG_LEVEL", "DEBUG")
-
-        settings = load_settings()
-
-        assert settings.llm.endpoint == "http://test:11434"
-        assert settings.llm.model == "test-model"
-        assert settings.llm.timeout == 90
-        assert settings.vault is not None
-        assert str(settings.vault.path) == "/test/vault"
-        assert settings.vault.recipes_dir == "recipes"
-        assert settings.log_level == "DEBUG"
-
-    def test_load_settings_with_llm_base_url(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Test that LLM_BASE_URL environment variable is supported."""
-        monkeypatch.setenv("LLM_BASE_URL", "http://ollama:11434")
-        monkeypatch.setenv("RECIPE_INGEST_LLM_MODEL", "test-model")
+    @pytest.mark.parametrize(("env", "expected"), ENV_CASES)
+    def test_load_settings_from_env(
+        self, monkeypatch: pytest.MonkeyPatch, env: dict[str, str], expected: dict[str, Any]
+    ) -> None:
+        """Test that load_settings maps environment variables onto the settings."""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
 
         settings = load_settings()
 
-        assert settings.llm.endpoint == "http://ollama:11434"
-        assert settings.llm.model == "test-model"
-
-    def test_load_settings_with_partial_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Test loading settings with only some environment variables set."""
-        monkeypatch.setenv("RECIPE_INGEST_LLM_MODEL", "custom-model")
+        for path, value in expected.items():
+            assert attrgetter(path)(settings) == value, path
 
+    def test_load_settings_is_cached_per_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that cached settings are copied per call and refreshed when env changes."""
+        monkeypatch.setenv("RECIPE_INGEST_LLM_MODEL", "cached-model")
         settings = load_settings()
+        # Mutating one caller's copy must not leak into the cache
+        settings.llm.model = "mutated"
+        assert load_settings().llm.model == "cached-model"
 
-        # Model from env, endpoint from default
-        assert settings.llm.model == "custom-model"
-        assert settings.llm.endpoint == "http://localhost:11434"
-        assert settings.vault is None
-
-    def test_load_settings_env_vars_override_defaults(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that environment variables properly override defaults."""
-        monkeypatch.setenv("RECIPE_INGEST_LLM_ENDPOINT", "http://custom:11434")
-        monkeypatch.setenv("RECIPE_INGEST_LLM_TIMEOUT", "60")
-
-        settings = load_settings()
-
-        assert settings.llm.endpoint == "http://custom:11434"
-        assert settings.llm.timeout == 60
-        assert settings.llm.model == "llama3.1:8b"  # Still default
+        monkeypatch.setenv("RECIPE_INGEST_LLM_MODEL", "other-model")
+        assert load_settings().llm.model == "other-model"
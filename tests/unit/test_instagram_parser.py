@@ -1,90 +1,162 @@
 """Unit tests for Instagram parser."""
 
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
 import pytest
-from pytest_mock import MockerFixture
 
 # Try to import InstagramParser, skip all tests if not available
 try:
+    import instaloader.exceptions
+
     from recipe_ingest.parsers.instagram import InstagramParser
+
+    # Post.from_shortcode failure -> (exception parse() raises, message it must match)
+    _FETCH_ERROR_CASES = [
+        pytest.param(
+            instaloader.exceptions.PostChangedException("Post not found"),
+            ConnectionError,
+            "not found or has been changed",
+            id="post-changed",
+        ),
+        pytest.param(
+            instaloader.exceptions.PrivateProfileNotFollowedException("Private profile"),
+            ValueError,
+            "private account",
+            id="private-profile",
+        ),
+        pytest.param(
+            instaloader.exceptions.ConnectionException("Connection failed"),
+            ConnectionError,
+            "Failed to connect to Instagram",
+            id="connection-error",
+        ),
+        pytest.param(
+            instaloader.exceptions.LoginRequiredException("Login required"),
+            ConnectionError,
+            "requires login",
+            id="login-required",
+        ),
+        # Not a ConnectionException subclass, so it reaches the outer handler
+        pytest.param(
+            instaloader.exceptions.InstaloaderException("Unexpected response"),
+            ConnectionError,
+            "Failed to extract content",
+            id="other-instaloader-error",
+        ),
+        pytest.param(
+            OSError("Network unreachable"),
+            ConnectionError,
+            "Failed to extract content",
+            id="os-error",
+        ),
+        # Unexpected (non-instaloader) errors propagate unchanged
+        pytest.param(
+            RuntimeError("Unexpected error"), RuntimeError, "Unexpected error", id="unexpected"
+        ),
+    ]
 except ImportError:
     InstagramParser = None  # type: ignore[assignment, misc]
+    _FETCH_ERROR_CASES = []
     pytestmark = pytest.mark.skip(reason="InstagramParser not available (lzma dependency missing)")
 
 
-class TestInstagramParser:
-    """Tests for InstagramParser class."""
+@pytest.fixture(scope="module")
+def parser() -> InstagramParser:
+    """Shared parser; it keeps no per-call state, so one instance serves the module."""
+    return InstagramParser()
 
-    def test_is_instagram_url_with_post_url(self) -> None:
-        """Test URL detection for standard post URLs."""
-        parser = InstagramParser()
-        assert parser.is_instagram_url("https://www.instagram.com/p/ABC123/")
-        assert parser.is_instagram_url("https://instagram.com/p/ABC123/")
-        assert parser.is_instagram_url("http://www.instagram.com/p/ABC123/")
-        assert parser.is_instagram_url("https://www.instagram.com/p/ABC123/?utm_source=test")
-
-    def test_is_instagram_url_with_reel_url(self) -> None:
-        """Test URL detection for reel URLs."""
-        parser = InstagramParser()
-        assert parser.is_instagram_url("https://www.instagram.com/reel/ABC123/")
-        assert parser.is_instagram_url("https://instagram.com/reel/ABC123/")
-        assert parser.is_instagram_url("https://www.instagram.com/reel/ABC123/?utm_source=test")
-
-    def test_is_instagram_url_with_tv_url(self) -> None:
-        """Test URL detection for IGTV URLs."""
-        parser = InstagramParser()
-        assert parser.is_instagram_url("https://www.instagram.com/tv/ABC123/")
-        assert parser.is_instagram_url("https://instagram.com/tv/ABC123/")
-        assert parser.is_instagram_url("https://www.instagram.com/tv/ABC123/?utm_source=test")
-
-    def test_is_instagram_url_with_invalid_urls(self) -> None:
-        """Test URL detection rejects non-Instagram URLs."""
-        parser = InstagramParser()
-        assert not parser.is_instagram_url("https://www.example.com/p/ABC123/")
-        assert not parser.is_instagram_url("not a url")
-        assert not parser.is_instagram_url("")
-        assert not parser.is_instagram_url("https://www.facebook.com/p/ABC123/")
-
-    def test_extract_shortcode_from_post_url(self) -> None:
-        """Test shortcode extraction from post URL."""
-        parser = InstagramParser()
-        assert parser._extract_shortcode("https://www.instagram.com/p/ABC123/") == "ABC123"
-        assert parser._extract_shortcode("https://instagram.com/p/XYZ789/") == "XYZ789"
-        assert (
-            parser._extract_shortcode("https://www.instagram.com/p/ABC123/?utm_source=test")
-            == "ABC123"
-        )
 
-    def test_extract_shortcode_from_reel_url(self) -> None:
-        """Test shortcode extraction from reel URL."""
-        parser = InstagramParser()
-        assert parser._extract_shortcode("https://www.instagram.com/reel/ABC123/") == "ABC123"
-        assert parser._extract_shortcode("https://instagram.com/reel/XYZ789/") == "XYZ789"
+@pytest.fixture
+def mock_from_shortcode() -> Iterator[MagicMock]:
+    """Patch instaloader's Post.from_shortcode for one test.
+
+    Tests configure the yielded mock's return_value (the fetched post) or
+    side_effect (a fetch failure).
+
+    Yields:
+        The patched from_shortcode mock
+    """
+    with patch.object(instaloader.Post, "from_shortcode") as mock:
+        yield mock
 
-    def test_extract_shortcode_from_tv_url(self) -> None:
-        """Test shortcode extraction from IGTV URL."""
-        parser = InstagramParser()
-        assert parser._extract_shortcode("https://www.instagram.com/tv/ABC123/") == "ABC123"
-        assert parser._extract_shortcode("https://instagram.com/tv/XYZ789/") == "XYZ789"
 
-    def test_extract_shortcode_with_invalid_url_raises_error(self) -> None:
+class TestInstagramParser:
+    """Tests for InstagramParser class."""
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            pytest.param("https://www.instagram.com/p/ABC123/", True, id="post"),
+            pytest.param("https://instagram.com/p/ABC123/", True, id="post-no-www"),
+            pytest.param("http://www.instagram.com/p/ABC123/", True, id="post-http"),
+            pytest.param(
+                "https://www.instagram.com/p/ABC123/?utm_source=test", True, id="post-query"
+            ),
+            pytest.param("https://www.instagram.com/reel/ABC123/", True, id="reel"),
+            pytest.param("https://instagram.com/reel/ABC123/", True, id="reel-no-www"),
+            pytest.param(
+                "https://www.instagram.com/reel/ABC123/?utm_source=test", True, id="reel-query"
+            ),
+            pytest.param("https://www.instagram.com/tv/ABC123/", True, id="tv"),
+            pytest.param("https://instagram.com/tv/ABC123/", True, id="tv-no-www"),
+            pytest.param(
+                "https://www.instagram.com/tv/ABC123/?utm_source=test", True, id="tv-query"
+            ),
+            pytest.param("https://www.example.com/p/ABC123/", False, id="wrong-domain"),
+            pytest.param("https://www.facebook.com/p/ABC123/", False, id="facebook"),
+            pytest.param("not a url", False, id="garbage"),
+            pytest.param("", False, id="empty"),
+            # Raw (undecoded) URLs are accepted as bytes
+            pytest.param(b"https://www.instagram.com/p/ABC123/", True, id="bytes-post"),
+            pytest.param(
+                bytearray(b"https://instagram.com/reel/ABC123/"), True, id="bytearray-reel"
+            ),
+            pytest.param(b"https://www.example.com/p/ABC123/", False, id="bytes-wrong-domain"),
+            pytest.param(b"", False, id="bytes-empty"),
+        ],
+    )
+    def test_is_instagram_url(
+        self, parser: InstagramParser, url: str | bytes, expected: bool
+    ) -> None:
+        """Test URL detection for post, reel and IGTV links, as str or bytes."""
+        assert parser.is_instagram_url(url) is expected
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            pytest.param("https://www.instagram.com/p/ABC123/", "ABC123", id="post"),
+            pytest.param("https://instagram.com/p/XYZ789/", "XYZ789", id="post-no-www"),
+            pytest.param(
+                "https://www.instagram.com/p/ABC123/?utm_source=test",
+                "ABC123",
+                id="post-query-string",
+            ),
+            pytest.param("https://www.instagram.com/reel/ABC123/", "ABC123", id="reel"),
+            pytest.param("https://instagram.com/reel/XYZ789/", "XYZ789", id="reel-no-www"),
+            pytest.param("https://www.instagram.com/tv/ABC123/", "ABC123", id="tv"),
+            pytest.param("https://instagram.com/tv/XYZ789/", "XYZ789", id="tv-no-www"),
+        ],
+    )
+    def test_extract_shortcode_valid(
+        self, parser: InstagramParser, url: str, expected: str
+    ) -> None:
+        """Test shortcode extraction from post, reel and IGTV URLs."""
+        assert parser._extract_shortcode(url) == expected
+
+    def test_extract_shortcode_with_invalid_url_raises_error(self, parser: InstagramParser) -> None:
         """Test that invalid URL format raises ValueError."""
-        parser = InstagramParser()
         with pytest.raises(ValueError, match="Could not extract shortcode"):
             parser._extract_shortcode("https://www.instagram.com/invalid/")
 
-    def test_parse_with_valid_url_returns_caption(self, mocker: MockerFixture) -> None:
+    def test_parse_with_valid_url_returns_caption(
+        self, parser: InstagramParser, mock_from_shortcode: MagicMock
+    ) -> None:
         """Test successful caption extraction from Instagram URL."""
-        parser = InstagramParser()
-
-        # Mock instaloader Post
-        mock_post = mocker.Mock()
-        mock_post.caption = (
+        mock_from_shortcode.return_value.caption = (
             "Delicious chocolate cake recipe! Ingredients: 2 cups flour, 1 cup sugar..."
         )
 
-        # Mock Post.from_shortcode
-        mocker.patch("instaloader.Post.from_shortcode", return_value=mock_post)
-
         url = "https://www.instagram.com/p/ABC123/"
         result = parser.parse(url)
 
@@ -94,119 +166,68 @@ class TestInstagramParser:
         assert isinstance(result, str)
         assert len(result) > 0
 
-    def test_parse_with_invalid_url_raises_error(self) -> None:
+    def test_parse_with_invalid_url_raises_error(self, parser: InstagramParser) -> None:
         """Test that invalid URL raises ValueError."""
-        parser = InstagramParser()
         with pytest.raises(ValueError, match="Invalid Instagram URL"):
             parser.parse("https://www.example.com/p/ABC123/")
 
-    def test_parse_with_no_caption_raises_error(self, mocker: MockerFixture) -> None:
-        """Test that post without caption raises ValueError."""
-        parser = InstagramParser()
-
-        # Mock instaloader Post with no caption
-        mock_post = mocker.Mock()
-        mock_post.caption = None
-
-        # Mock Post.from_shortcode
-        mocker.patch("instaloader.Post.from_shortcode", return_value=mock_post)
-
-        url = "https://www.instagram.com/p/ABC123/"
-        with pytest.raises(ValueError, match="does not contain a caption"):
+    def test_parse_with_bytes_url_returns_caption(
+        self, parser: InstagramParser, mock_from_shortcode: MagicMock
+    ) -> None:
+        """Test that a bytes URL is decoded and parsed like its str form."""
+        mock_from_shortcode.return_value.caption = "Pasta recipe"
+
+        assert parser.parse(b"https://www.instagram.com/p/ABC123/?igsh=x") == "Pasta recipe"
+        assert mock_from_shortcode.call_args.args[1] == "ABC123"
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            pytest.param(b"https://www.example.com/p/ABC123/", id="bytes-wrong-domain"),
+            pytest.param(b"https://www.instagram.com/p/\xff/", id="bytes-not-utf8"),
+        ],
+    )
+    def test_parse_with_invalid_bytes_url_raises_error(
+        self, parser: InstagramParser, url: bytes
+    ) -> None:
+        """Test that invalid bytes URLs raise ValueError, not TypeError."""
+        with pytest.raises(ValueError, match="Invalid Instagram URL"):
             parser.parse(url)
 
-    def test_parse_with_empty_caption_raises_error(self, mocker: MockerFixture) -> None:
-        """Test that post with empty caption raises ValueError."""
-        parser = InstagramParser()
-
-        # Mock instaloader Post with empty caption
-        mock_post = mocker.Mock()
-        mock_post.caption = ""
-
-        # Mock Post.from_shortcode
-        mocker.patch("instaloader.Post.from_shortcode", return_value=mock_post)
+    def test_parse_with_no_caption_raises_error(
+        self, parser: InstagramParser, mock_from_shortcode: MagicMock
+    ) -> None:
+        """Test that post without caption raises ValueError."""
+        # Fetched post with no caption
+        mock_from_shortcode.return_value.caption = None
 
         url = "https://www.instagram.com/p/ABC123/"
         with pytest.raises(ValueError, match="does not contain a caption"):
             parser.parse(url)
 
-    def test_parse_with_post_not_found_raises_connection_error(self, mocker: MockerFixture) -> None:
-        """Test that post not found raises ConnectionError."""
-        parser = InstagramParser()
-
-        # Mock Post.from_shortcode to raise PostChangedException
-        import instaloader.exceptions
-
-        mocker.patch(
-            "instaloader.Post.from_shortcode",
-            side_effect=instaloader.exceptions.PostChangedException("Post not found"),
-        )
-
-        url = "https://www.instagram.com/p/ABC123/"
-        with pytest.raises(ConnectionError, match="not found or has been changed"):
-            parser.parse(url)
-
-    def test_parse_with_private_profile_raises_value_error(self, mocker: MockerFixture) -> None:
-        """Test that private profile raises ValueError."""
-        parser = InstagramParser()
-
-        # Mock Post.from_shortcode to raise PrivateProfileNotFollowedException
-        import instaloader.exceptions
-
-        mocker.patch(
-            "instaloader.Post.from_shortcode",
-            side_effect=instaloader.exceptions.PrivateProfileNotFollowedException(
-                "Private profile"
-            ),
-        )
-
-        url = "https://www.instagram.com/p/ABC123/"
-        with pytest.raises(ValueError, match="private account"):
-            parser.parse(url)
-
-    def test_parse_with_connection_error_raises_connection_error(
-        self, mocker: MockerFixture
+    def test_parse_with_empty_caption_raises_error(
+        self, parser: InstagramParser, mock_from_shortcode: MagicMock
     ) -> None:
-        """Test that connection errors raise ConnectionError."""
-        parser = InstagramParser()
-
-        # Mock Post.from_shortcode to raise ConnectionException
-        import instaloader.exceptions
-
-        mocker.patch(
-            "instaloader.Post.from_shortcode",
-            side_effect=instaloader.exceptions.ConnectionException("Connection failed"),
-        )
-
-        url = "https://www.instagram.com/p/ABC123/"
-        with pytest.raises(ConnectionError, match="Failed to connect to Instagram"):
-            parser.parse(url)
-
-    def test_parse_with_login_required_raises_connection_error(self, mocker: MockerFixture) -> None:
-        """Test that login required raises ConnectionError."""
-        parser = InstagramParser()
-
-        # Mock Post.from_shortcode to raise LoginRequiredException
-        import instaloader.exceptions
-
-        mocker.patch(
-            "instaloader.Post.from_shortcode",
-            side_effect=instaloader.exceptions.LoginRequiredException("Login required"),
-        )
+        """Test that post with empty caption raises ValueError."""
+        # Fetched post with empty caption
+        mock_from_shortcode.return_value.caption = ""
 
         url = "https://www.instagram.com/p/ABC123/"
-        with pytest.raises(ConnectionError, match="requires login"):
+        with pytest.raises(ValueError, match="does not contain a caption"):
             parser.parse(url)
 
-    def test_parse_with_unexpected_error_raises_connection_error(
-        self, mocker: MockerFixture
+    @pytest.mark.parametrize(("error", "expected_type", "match"), _FETCH_ERROR_CASES)
+    def test_parse_maps_fetch_errors(
+        self,
+        parser: InstagramParser,
+        mock_from_shortcode: MagicMock,
+        error: Exception,
+        expected_type: type[Exception],
+        match: str,
     ) -> None:
-        """Test that unexpected errors raise ConnectionError."""
-        parser = InstagramParser()
-
-        # Mock Post.from_shortcode to raise generic exception
-        mocker.patch("instaloader.Post.from_shortcode", side_effect=Exception("Unexpected error"))
+        """Test how each Post.from_shortcode failure surfaces from parse()."""
+        mock_from_shortcode.side_effect = error
 
         url = "https://www.instagram.com/p/ABC123/"
-        with pytest.raises(ConnectionError, match="Failed to load Instagram post"):
+        with pytest.raises(expected_type, match=match):
             parser.parse(url)
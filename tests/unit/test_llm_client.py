@@ -0,0 +1,212 @@
+"""Unit tests for the Ollama client."""
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from recipe_ingest.llm import OllamaClient
+
+
+def _chunk(response: str, done: bool = False) -> bytes:
+    """Encode one NDJSON line of an Ollama generate stream."""
+    return json.dumps({"response": response, "done": done}).encode()
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    """Mock HTTP session handed to the client as a shared session.
+
+    Returns:
+        Session mock whose post() returns a streaming response mock
+    """
+    session = MagicMock(spec=requests.Session)
+    response = session.post.return_value
+    response.__enter__.return_value = response
+    return session
+
+
+def _stream(session: MagicMock, lines: Iterable[bytes]) -> None:
+    """Make the session's next POST stream the given lines."""
+    session.post.return_value.iter_lines.return_value = iter(lines)
+
+
+class TestGenerateStreaming:
+    """Tests for OllamaClient.generate reading a streamed response."""
+
+    def test_chunks_are_joined_and_parsed(self, session: MagicMock) -> None:
+        """Test response fragments are joined into one JSON document."""
+        _stream(session, [_chunk('{"title": '), _chunk('"Pasta"}'), _chunk("", done=True)])
+        client = OllamaClient(session=session)
+
+        assert client.generate("Extract") == {"title": "Pasta"}
+        assert session.post.call_args.kwargs["stream"] is True
+
+    def test_blank_lines_are_skipped(self, session: MagicMock) -> None:
+        """Test keep-alive blank lines between chunks are ignored."""
+        _stream(session, [b"", _chunk("plain "), b"", _chunk("text", done=True)])
+        client = OllamaClient(session=session)
+
+        assert client.generate("Say hi", format_json=False) == {"response": "plain text"}
+
+    def test_error_chunk_raises_connection_error(self, session: MagicMock) -> None:
+        """Test an error reported mid-stream raises ConnectionError."""
+        _stream(session, [_chunk("{"), json.dumps({"error": "model unloaded"}).encode()])
+        client = OllamaClient(session=session)
+
+        with pytest.raises(ConnectionError, match="model unloaded"):
+            client.generate("Extract")
+
+    def test_invalid_chunk_raises_value_error(self, session: MagicMock) -> None:
+        """Test a stream line that is not JSON raises ValueError."""
+        _stream(session, [b"not json"])
+        client = OllamaClient(session=session)
+
+        with pytest.raises(ValueError, match="Invalid stream chunk"):
+            client.generate("Extract")
+
+    def test_mid_stream_drop_raises_connection_error(self, session: MagicMock) -> None:
+        """Test a connection dropped after the first chunk raises ConnectionError."""
+
+        def dropped() -> Iterator[bytes]:
+            yield _chunk('{"title": ')
+            raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+        session.post.return_value.iter_lines.return_value = dropped()
+        client = OllamaClient(session=session)
+
+        with pytest.raises(ConnectionError, match="Connection broken"):
+            client.generate("Extract")
+
+    def test_stream_without_done_raises_connection_error(self, session: MagicMock) -> None:
+        """Test a stream that closes before the final chunk raises ConnectionError."""
+        _stream(session, [_chunk('{"title": ')])
+        client = OllamaClient(session=session)
+
+        with pytest.raises(ConnectionError, match="ended before generation finished"):
+            client.generate("Extract")
+
+    def test_http_error_raises_connection_error(self, session: MagicMock) -> None:
+        """Test an HTTP error status raises ConnectionError."""
+        session.post.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            "500 Server Error"
+        )
+        client = OllamaClient(session=session)
+
+        with pytest.raises(ConnectionError, match="HTTP error"):
+            client.generate("Extract")
+
+
+class TestGeneratePayload:
+    """Tests for the request payload OllamaClient.generate sends."""
+
+    SCHEMA = {"type": "object", "properties": {"title": {"type": "string"}}}
+
+    @pytest.fixture(autouse=True)
+    def _done_stream(self, session: MagicMock) -> None:
+        """Answer every POST with a minimal complete stream."""
+        _stream(session, [_chunk("{}", done=True)])
+
+    def test_defaults_omit_optional_fields(self, session: MagicMock) -> None:
+        """Test options and keep_alive are only sent when configured."""
+        OllamaClient(model="test-model", session=session).generate("Extract")
+
+        payload = session.post.call_args.kwargs["json"]
+        assert payload["model"] == "test-model"
+        assert payload["format"] == "json"
+        assert "options" not in payload
+        assert "keep_alive" not in payload
+
+    def test_num_predict_and_keep_alive(self, session: MagicMock) -> None:
+        """Test num_predict goes in options and keep_alive is passed through."""
+        OllamaClient(session=session, num_predict=256, keep_alive="30m").generate("Extract")
+
+        payload = session.post.call_args.kwargs["json"]
+        assert payload["options"] == {"num_predict": 256}
+        assert payload["keep_alive"] == "30m"
+
+    @pytest.mark.parametrize(
+        ("structured_output", "expected_format"),
+        [
+            pytest.param(True, SCHEMA, id="structured"),
+            pytest.param(False, "json", id="plain-json"),
+        ],
+    )
+    def test_format_with_schema(
+        self, session: MagicMock, structured_output: bool, expected_format: Any
+    ) -> None:
+        """Test the schema is sent as format only when structured output is enabled."""
+        client = OllamaClient(session=session, structured_output=structured_output)
+        client.generate("Extract", schema=self.SCHEMA)
+
+        payload = session.post.call_args.kwargs["json"]
+        assert payload["format"] == expected_format
+        assert payload["prompt"].endswith(json.dumps(self.SCHEMA, separators=(",", ":")))
+
+    def test_no_format_without_format_json(self, session: MagicMock) -> None:
+        """Test format is omitted when JSON output is not requested."""
+        client = OllamaClient(session=session, structured_output=True)
+        client.generate("Say hi", schema=self.SCHEMA, format_json=False)
+
+        assert "format" not in session.post.call_args.kwargs["json"]
+
+
+class TestPreload:
+    """Tests for OllamaClient.preload."""
+
+    @pytest.mark.parametrize(
+        ("client_keep_alive", "keep_alive", "expected"),
+        [
+            pytest.param(None, None, "30m", id="default"),
+            pytest.param("1h", None, "1h", id="client-value"),
+            pytest.param("1h", -1, -1, id="argument"),
+        ],
+    )
+    def test_payload(
+        self,
+        session: MagicMock,
+        client_keep_alive: str | None,
+        keep_alive: int | None,
+        expected: str | int,
+    ) -> None:
+        """Test preload sends an empty prompt with the resolved keep_alive."""
+        client = OllamaClient(model="test-model", keep_alive=client_keep_alive, session=session)
+        client.preload(keep_alive)
+
+        assert session.post.call_args.kwargs["json"] == {
+            "model": "test-model",
+            "prompt": "",
+            "keep_alive": expected,
+        }
+
+    def test_request_error_raises_connection_error(self, session: MagicMock) -> None:
+        """Test a failed preload request raises ConnectionError."""
+        session.post.side_effect = requests.exceptions.ConnectionError("refused")
+        client = OllamaClient(model="test-model", session=session)
+
+        with pytest.raises(ConnectionError, match="Failed to preload Ollama model 'test-model'"):
+            client.preload()
+
+
+class TestSessionOwnership:
+    """Tests for which HTTP session OllamaClient.close() closes."""
+
+    def test_close_leaves_shared_session_open(self, session: MagicMock) -> None:
+        """Test a session passed in by the caller is not closed."""
+        with OllamaClient(session=session):
+            pass
+
+        session.close.assert_not_called()
+
+    def test_close_closes_private_session(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a session created by the client is closed on exit."""
+        private = MagicMock(spec=requests.Session)
+        monkeypatch.setattr(requests, "Session", lambda: private)
+
+        with OllamaClient() as client:
+            assert client._session is private
+
+        private.close.assert_called_once_with()
@@ -1,61 +1,113 @@
 """Unit tests for vault writer."""
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
 
 from recipe_ingest.core.writer import VaultWriter
 
 
-class TestVaultWriter:
-    """Tests for VaultWriter class."""
+@pytest.fixture
+def fake_vault(fs: FakeFilesystem) -> Path:
+    """Create an Obsidian vault on pyfakefs's in-memory filesystem.
+
+    File operations in the test (including the writer's temp file and atomic
+    rename) hit the fake filesystem instead of disk.
+
+    Returns:
+        Path to the fake vault directory
+    """
+    vault_path = Path("/vault")
+    fs.create_dir(vault_path / "personal" / "recipes")
+    return vault_path
+
+
+@pytest.fixture(scope="module")
+def writer_factory(module_vault: Path) -> Callable[..., VaultWriter]:
+    """Factory for writers on the module-scoped vault, memoized by recipes_dir.
+
+    Only for tests that never write files; tests that write, overwrite or check
+    for duplicates should build their own writer on fake_vault.
+
+    Returns:
+        Callable taking an optional recipes_dir and returning its shared writer
+    """
+    writers: dict[str, VaultWriter] = {}
+
+    def make(recipes_dir: str = "personal/recipes") -> VaultWriter:
+        if recipes_dir not in writers:
+            writers[recipes_dir] = VaultWriter(module_vault, recipes_dir)
+        return writers[recipes_dir]
+
+    return make
 
-    def test_init_with_nonexistent_vault_raises_error(self, tmp_path: Path) -> None:
-        """Test that initializing with nonexistent vault raises ValueError."""
-        fake_path = tmp_path / "nonexistent"
-        with pytest.raises(ValueError, match="Vault path does not exist"):
-            VaultWriter(fake_path)
 
-    def test_init_with_file_instead_of_directory_raises_error(self, tmp_path: Path) -> None:
-        """Test that initializing with a file raises ValueError."""
-        file_path = tmp_path / "file.txt"
-        file_path.write_text("test")
-        with pytest.raises(ValueError, match="not a directory"):
-            VaultWriter(file_path)
+@pytest.fixture(scope="module")
+def shared_writer(writer_factory: Callable[..., VaultWriter]) -> VaultWriter:
+    """Writer for the default recipes directory, shared by pure-helper tests.
 
-    def test_init_creates_recipes_directory(self, temp_vault: Path) -> None:
+    Returns:
+        VaultWriter for the module-scoped vault
+    """
+    return writer_factory()
+
+
+class TestVaultWriter:
+    """Tests for VaultWriter class."""
+
+    @pytest.mark.parametrize(
+        ("name", "create_file", "match"),
+        [
+            pytest.param("nonexistent", False, "Vault path does not exist", id="nonexistent"),
+            pytest.param("file.txt", True, "not a directory", id="file-not-directory"),
+        ],
+    )
+    def test_init_with_invalid_vault_raises_error(
+        self, tmp_path: Path, name: str, create_file: bool, match: str
+    ) -> None:
+        """Test that a missing vault path or a file instead of a directory raises ValueError."""
+        vault_path = tmp_path / name
+        if create_file:
+            vault_path.write_text("test")
+        with pytest.raises(ValueError, match=match):
+            VaultWriter(vault_path)
+
+    def test_init_creates_recipes_directory(self, fake_vault: Path) -> None:
         """Test that writer creates recipes directory if it doesn't exist."""
-        # Remove recipes dir if it exists
-        recipes_dir = temp_vault / "personal" / "recipes"
-        if recipes_dir.exists():
-            recipes_dir.rmdir()
+        # fake_vault only pre-creates personal/recipes, so this directory is new
+        recipes_dir = fake_vault / "personal" / "newly_created_recipes"
 
-        writer = VaultWriter(temp_vault, "personal/recipes")
+        writer = VaultWriter(fake_vault, "personal/newly_created_recipes")
+        assert writer.recipes_dir == recipes_dir
         assert writer.recipes_dir.exists()
         assert writer.recipes_dir.is_dir()
 
-    def test_init_with_custom_recipes_dir(self, temp_vault: Path) -> None:
+    def test_init_with_custom_recipes_dir(
+        self, module_vault: Path, writer_factory: Callable[..., VaultWriter]
+    ) -> None:
         """Test that writer uses custom recipes directory."""
         custom_dir = "custom/recipes/path"
-        writer = VaultWriter(temp_vault, custom_dir)
-        assert writer.recipes_dir == temp_vault / custom_dir
+        writer = writer_factory(custom_dir)
+        assert writer.recipes_dir == module_vault / custom_dir
         assert writer.recipes_dir.exists()
 
-    def test_write_creates_new_file(self, temp_vault: Path) -> None:
+    def test_write_creates_new_file(self, fake_vault: Path) -> None:
         """Test writing a new recipe file."""
-        writer = VaultWriter(temp_vault)
+        writer = VaultWriter(fake_vault)
         content = "# Test Recipe\n\nSome content"
 
         file_path = writer.write("Test Recipe", content)
 
         assert file_path.exists()
         assert file_path.is_file()
-        assert file_path.read_text() == content
+        assert file_path.read_bytes() == content.encode("utf-8")
         assert file_path.name == "Test Recipe.md"
 
-    def test_write_sanitizes_filename(self, temp_vault: Path) -> None:
+    def test_write_sanitizes_filename(self, fake_vault: Path) -> None:
         """Test that filenames are properly sanitized."""
-        writer = VaultWriter(temp_vault)
+        writer = VaultWriter(fake_vault)
         content = "test content"
 
         # Test various problematic characters
@@ -68,9 +120,9 @@ class TestVaultWriter:
         assert '"' not in file_path.name
         assert ":" not in file_path.name
 
-    def test_write_without_overwrite_raises_on_duplicate(self, temp_vault: Path) -> None:
+    def test_write_without_overwrite_raises_on_duplicate(self, fake_vault: Path) -> None:
         """Test that writing duplicate without overwrite raises error."""
-        writer = VaultWriter(temp_vault)
+        writer = VaultWriter(fake_vault)
         content = "test content"
 
         # Write first time
@@ -80,9 +132,9 @@ class TestVaultWriter:
         with pytest.raises(FileExistsError, match="already exists"):
             writer.write("Duplicate Test", content, overwrite=False)
 
-    def test_write_with_overwrite_replaces_file(self, temp_vault: Path) -> None:
+    def test_write_with_overwrite_replaces_file(self, fake_vault: Path) -> None:
         """Test that overwrite flag allows replacing existing files."""
-        writer = VaultWriter(temp_vault)
+        writer = VaultWriter(fake_vault)
 
         # Write first version
         file_path = writer.write("Overwrite Test", "original content")
@@ -92,9 +144,9 @@ class TestVaultWriter:
         file_path = writer.write("Overwrite Test", "new content", overwrite=True)
         assert file_path.read_text() == "new content"
 
-    def test_check_duplicate_returns_true_for_existing(self, temp_vault: Path) -> None:
+    def test_check_duplicate_returns_true_for_existing(self, fake_vault: Path) -> None:
         """Test that check_duplicate detects existing recipes."""
-        writer = VaultWriter(temp_vault)
+        writer = VaultWriter(fake_vault)
 
         # No duplicate initially
         assert not writer.check_duplicate("New Recipe")
@@ -105,22 +157,21 @@ class TestVaultWriter:
         # Now should be duplicate
         assert writer.check_duplicate("New Recipe")
 
-    def test_sanitize_filename_handles_long_names(self, temp_vault: Path) -> None:
-        """Test that very long filenames are truncated."""
-        writer = VaultWriter(temp_vault)
-        long_title = "A" * 300  # Longer than max length
-
-        sanitized = writer._sanitize_filename(long_title)
-
-        assert len(sanitized) <= 200
-        assert sanitized.startswith("A")
-
-    def test_sanitize_filename_handles_empty_result(self, temp_vault: Path) -> None:
-        """Test that empty titles get a fallback name."""
-        writer = VaultWriter(temp_vault)
-
-        sanitized = writer._sanitize_filename("***")
-        assert sanitized == "untitled_recipe"
-
-        sanitized = writer._sanitize_filename("")
-        assert sanitized == "untitled_recipe"
+    @pytest.mark.parametrize(
+        ("title", "expected"),
+        [
+            pytest.param(
+                'Test: Recipe / With * "Invalid" Chars',
+                "Test Recipe With Invalid Chars",
+                id="invalid-chars",
+            ),
+            # Longer than the 200-character limit
+            pytest.param("A" * 300, "A" * 200, id="long-name"),
+            # Empty titles get a fallback name
+            pytest.param("***", "untitled_recipe", id="only-invalid-chars"),
+            pytest.param("", "untitled_recipe", id="empty"),
+        ],
+    )
+    def test_sanitize_filename(self, shared_writer: VaultWriter, title: str, expected: str) -> None:
+        """Test that titles are sanitized, truncated, or replaced with a fallback."""
+        assert shared_writer._sanitize_filename(title) == expected